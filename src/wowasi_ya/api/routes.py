@@ -22,7 +22,7 @@ from wowasi_ya.core import (
 from wowasi_ya.core.next_steps import NextStepsEngine, get_next_steps_engine
 from wowasi_ya.core.privacy import PrivacyScanResult
 from wowasi_ya.models.agent import AgentDefinition, DomainMatch
-from wowasi_ya.models.document import DocumentType, GeneratedProject
+from wowasi_ya.models.document import DOCUMENT_LIST_ADAPTER, DocumentType, GeneratedProject
 from wowasi_ya.models.next_steps import (
     ProjectNextStep,
     ProjectProgress,
@@ -446,7 +446,6 @@ async def publish_to_outline(
     Only available after generation is complete.
     """
     from wowasi_ya.core.outline import OutlinePublisher
-    from wowasi_ya.models.document import Document, GeneratedProject
 
     state = project_states.get(project_id)
     if not state:
@@ -466,11 +465,11 @@ async def publish_to_outline(
         )
 
     # Reconstruct GeneratedProject from stored data
-    documents = [Document(**d) for d in state.generated_documents]
+    documents = DOCUMENT_LIST_ADAPTER.validate_python(state.generated_documents)
     generated_project = GeneratedProject(
         project_name=state.input.name,
         project_area=state.input.area or "04_Iyeska",
-        documents=documents,
+        documents=tuple(documents),
     )
 
     # Publish to Outline
@@ -554,7 +553,11 @@ async def run_generation_pipeline(
         research_engine = ResearchEngine(settings)
         agents = [AgentDefinition(**a) for a in state.discovered_agents]
         research_results = await research_engine.execute_all(agents, text_to_use)
-        state.research_results["agent_results"] = [r.model_dump() for r in research_results]
+        # Raw response text stays in memory for generation and in the research
+        # cache; the state store appends a full record on every save
+        state.research_results["agent_results"] = [
+            r.model_dump(exclude={"raw_response"}) for r in research_results
+        ]
 
         # Aggregate token usage from all research agents
         research_duration = time.time() - research_start
@@ -575,7 +578,9 @@ async def run_generation_pipeline(
 
         generator = DocumentGenerator(settings)
         generated_project = await generator.generate_all(state.input, research_results)
-        state.generated_documents = [d.model_dump() for d in generated_project.documents]
+        state.generated_documents = DOCUMENT_LIST_ADAPTER.dump_python(
+            list(generated_project.documents)
+        )
 
         # Calculate total words
         total_words = sum(len(d.content.split()) for d in generated_project.documents)
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
+from pydantic import TypeAdapter, ValidationError
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -20,7 +21,7 @@ from wowasi_ya.core import (
     QualityChecker,
     ResearchEngine,
 )
-from wowasi_ya.models.project import ProjectInput
+from wowasi_ya.models.project import OutputFormat, ProjectInput
 
 app = typer.Typer(
     name="wowasi",
@@ -29,6 +30,9 @@ app = typer.Typer(
 )
 console = Console()
 
+# Checks --format values against the destinations OutputManager supports
+_OUTPUT_FORMAT_ADAPTER = TypeAdapter(OutputFormat)
+
 
 @app.command()
 def version() -> None:
@@ -46,7 +50,9 @@ def generate(
     ] = None,
     output_format: Annotated[
         str,
-        typer.Option("--format", "-f", help="Output format: filesystem, obsidian, git"),
+        typer.Option(
+            "--format", "-f", help="Output format: filesystem, obsidian, git, gdrive, outline"
+        ),
     ] = "filesystem",
     output_dir: Annotated[
         Optional[Path],
@@ -76,12 +82,19 @@ def generate(
     6. Output
     7. Publish to Outline (optional, with --publish-to-outline)
     """
+    try:
+        validated_format = _OUTPUT_FORMAT_ADAPTER.validate_python(output_format)
+    except ValidationError:
+        raise typer.BadParameter(
+            f"{output_format!r} is not a supported output format", param_hint="'--format'"
+        ) from None
+
     asyncio.run(
         _generate_async(
             name=name,
             description=description,
             context=context,
-            output_format=output_format,
+            output_format=validated_format,
             output_dir=output_dir,
             skip_privacy=skip_privacy,
             publish_to_outline=publish_to_outline,
@@ -94,7 +107,7 @@ async def _generate_async(
     name: str,
     description: str,
     context: str | None,
-    output_format: str,
+    output_format: OutputFormat,
     output_dir: Path | None,
     skip_privacy: bool,
     publish_to_outline: bool = False,
@@ -370,7 +383,6 @@ async def _publish_async(
                 content=content,
                 folder=folder,
                 filename=filename,
-                word_count=len(content.split()),
             ))
 
     if not documents:
@@ -382,7 +394,7 @@ async def _publish_async(
     project = GeneratedProject(
         project_name=project_name,
         project_area="04_Iyeska",
-        documents=documents,
+        documents=tuple(documents),
         total_word_count=sum(d.word_count for d in documents),
     )
 
@@ -48,6 +48,7 @@ class Settings(BaseSettings):
     git_output_path: Path | None = None
     gdrive_remote_path: str = "gdrive:Wowasi"
     enable_gdrive_sync: bool = True
+    gdrive_archive_threshold: int = 0  # Upload one .tar.gz above this many docs (0 = off)
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./wowasi_ya.db"
@@ -66,6 +67,9 @@ class Settings(BaseSettings):
     max_generation_tokens: int = 64000  # Claude Sonnet 4.5 maximum output capacity
     enable_web_search: bool = True
     max_concurrent_research_agents: int = Field(default=1, ge=1, le=10)  # Rate limit protection
+    claude_rpm: int = Field(default=50, ge=0)  # Research requests per minute (0 = unlimited)
+    research_cache_ttl: int = Field(default=0, ge=0)  # Seconds to reuse results (0 = off)
+    research_timeout: int = Field(default=1800, ge=30, le=3600)  # Seconds per research agent call
 
     # LLM Provider Configuration
     generation_provider: Literal["claude", "llamacpp"] = "claude"  # Default to Claude API
@@ -2,8 +2,9 @@
 
 import re
 from dataclasses import dataclass
+from typing import cast
 
-from wowasi_ya.models.agent import AgentDefinition, DomainMatch
+from wowasi_ya.models.agent import AgentDefinition, AgentPriority, DomainMatch
 from wowasi_ya.models.project import ProjectInput
 
 
@@ -178,6 +179,14 @@ DOMAIN_MAPPINGS: list[DomainKeywords] = [
     ),
 ]
 
+# Word-boundary pattern per keyword, compiled once per domain
+_KEYWORD_PATTERNS: dict[str, tuple[tuple[str, re.Pattern[str]], ...]] = {
+    domain_def.domain: tuple(
+        (keyword, re.compile(rf"\b{re.escape(keyword)}\b")) for keyword in domain_def.keywords
+    )
+    for domain_def in DOMAIN_MAPPINGS
+}
+
 
 class AgentDiscoveryService:
     """Service for discovering and generating research agents based on project input.
@@ -204,13 +213,12 @@ class AgentDiscoveryService:
         matches: list[DomainMatch] = []
 
         for domain_def in self.domain_mappings:
-            matched_keywords: list[str] = []
-
-            for keyword in domain_def.keywords:
-                # Use word boundary matching for more accurate results
-                pattern = rf"\b{re.escape(keyword)}\b"
-                if re.search(pattern, text_lower):
-                    matched_keywords.append(keyword)
+            # Use word boundary matching for more accurate results
+            matched_keywords = [
+                keyword
+                for keyword, pattern in _KEYWORD_PATTERNS[domain_def.domain]
+                if pattern.search(text_lower)
+            ]
 
             if matched_keywords:
                 # Calculate confidence based on keyword matches
@@ -259,12 +267,13 @@ class AgentDiscoveryService:
                     id=f"agent_{agent_counter:03d}",
                     name=f"{match.domain.replace('_', ' ').title()} - {template['role']}",
                     role=template["role"],
-                    domains=[match.domain],
+                    domains=(match.domain,),
                     research_questions=self._generate_research_questions(
                         project, match, template
                     ),
                     search_queries=self._generate_search_queries(project, match, template),
-                    priority=min(agent_counter, 5),  # Cap at 5 (model constraint)
+                    # Cap at 5 (model constraint)
+                    priority=cast(AgentPriority, min(agent_counter, 5)),
                 )
                 agents.append(agent)
                 agent_counter += 1
@@ -276,14 +285,14 @@ class AgentDiscoveryService:
         project: ProjectInput,
         match: DomainMatch,
         template: dict[str, str],
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Generate research questions for an agent."""
-        questions = [
+        questions = (
             f"What are the key regulations and compliance requirements for {match.domain.replace('_', ' ')} projects?",
             f"What are best practices for {template['focus']}?",
             f"What stakeholder considerations apply to {', '.join(match.stakeholders[:2])}?",
             f"What common challenges and solutions exist for {match.domain.replace('_', ' ')} initiatives?",
-        ]
+        )
         return questions
 
     def _generate_search_queries(
@@ -291,13 +300,13 @@ class AgentDiscoveryService:
         project: ProjectInput,
         match: DomainMatch,
         template: dict[str, str],
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Generate web search queries for an agent."""
-        queries = [
+        queries = (
             f"{match.domain.replace('_', ' ')} {template['focus']} best practices 2024",
             f"{match.domain.replace('_', ' ')} compliance requirements",
             f"{project.name} {match.domain.replace('_', ' ')} regulations",
-        ]
+        )
         return queries
 
     def _create_documentation_framework_agent(self, project: ProjectInput) -> AgentDefinition:
@@ -316,15 +325,15 @@ class AgentDiscoveryService:
             id="agent_000_frameworks",
             name="Documentation Frameworks & Professional Standards",
             role="Senior Documentation Architect with 15+ years in nonprofit, tribal, and public sector",
-            domains=["documentation", "professional_standards", "project_management"],
-            research_questions=[
+            domains=("documentation", "professional_standards", "project_management"),
+            research_questions=(
                 "What are the industry-standard frameworks for professional project documentation? (e.g., SMART goals, RACI charts, risk matrices, Gantt conventions)",
                 "What are best practices and formatting conventions for executive-level project documentation in nonprofit/public sector?",
                 "What are concrete examples of well-written budget narratives, risk assessments, and SOPs for similar organizations?",
                 "What are the key differences between junior-level and senior-level project documentation in terms of depth, specificity, and strategic thinking?",
                 "What professional templates and structures are commonly used for project briefs, stakeholder notes, and status updates?",
-            ],
-            search_queries=[
+            ),
+            search_queries=(
                 "nonprofit project documentation best practices 2024",
                 "professional project management frameworks SMART goals RACI",
                 "executive-level budget narrative examples public sector",
@@ -333,7 +342,7 @@ class AgentDiscoveryService:
                 "project timeline Gantt chart best practices",
                 "stakeholder analysis frameworks project management",
                 "senior project manager documentation vs junior",
-            ],
+            ),
             priority=1,  # Highest priority - runs first
         )
 
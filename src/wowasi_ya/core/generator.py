@@ -14,7 +14,8 @@ from wowasi_ya.core.llm_client import BaseLLMClient, LLMResponse, get_generation
 logger = logging.getLogger(__name__)
 from wowasi_ya.models.agent import AgentResult
 from wowasi_ya.models.document import (
-    DOCUMENT_BATCHES,
+    BATCH_ORDER,
+    DOCUMENT_BATCHES_BY_NUMBER,
     Document,
     DocumentBatch,
     DocumentType,
@@ -172,8 +173,6 @@ class DocumentGenerator:
                 content=response.content,
                 folder=config["folder"],
                 filename=config["filename"],
-                generated_at=datetime.utcnow(),
-                word_count=len(response.content.split()),
             )
 
             return doc, response.input_tokens, response.output_tokens
@@ -2944,8 +2943,9 @@ Write the complete Glossary document now.
         total_input_tokens = 0
         total_output_tokens = 0
 
-        # Process batches in order (respecting dependencies)
-        for batch in DOCUMENT_BATCHES:
+        # Process batches in their precomputed dependency order
+        for batch_number in BATCH_ORDER:
+            batch = DOCUMENT_BATCHES_BY_NUMBER[batch_number]
             docs, input_tokens, output_tokens = await self.generate_batch(
                 batch, project, research_results, all_documents
             )
@@ -2969,7 +2969,7 @@ Write the complete Glossary document now.
         return GeneratedProject(
             project_name=project.name,
             project_area=project.area,
-            documents=all_documents,
+            documents=tuple(all_documents),
             total_word_count=sum(d.word_count for d in all_documents),
             generation_time_seconds=generation_time,
             created_at=start_time,
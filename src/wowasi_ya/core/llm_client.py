@@ -14,14 +14,54 @@ To add a new provider, implement BaseLLMClient protocol and update the factory.
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 import httpx
 
 from wowasi_ya.config import Settings
 
+if TYPE_CHECKING:
+    from anthropic import DefaultAsyncHttpxClient
+
 logger = logging.getLogger(__name__)
 
+# Pool limits for the HTTP client shared by research and generation
+_ANTHROPIC_MAX_CONNECTIONS = 64
+_ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# HTTP client shared by every Anthropic client in the process
+_anthropic_http_client: "DefaultAsyncHttpxClient | None" = None
+
+
+def get_anthropic_http_client() -> "DefaultAsyncHttpxClient":
+    """Get the HTTP client shared by every Anthropic client.
+
+    Research and generation reuse one connection pool instead of each
+    opening their own TCP/TLS connections.
+    """
+    global _anthropic_http_client
+    if _anthropic_http_client is None or _anthropic_http_client.is_closed:
+        import anthropic
+
+        # The SDK may be built on a different HTTP library than our own
+        # httpx, so take the limits type from the SDK itself
+        limits_type = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+        _anthropic_http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=limits_type(
+                max_connections=_ANTHROPIC_MAX_CONNECTIONS,
+                max_keepalive_connections=_ANTHROPIC_MAX_KEEPALIVE_CONNECTIONS,
+            )
+        )
+    return _anthropic_http_client
+
+
+async def close_anthropic_http_client() -> None:
+    """Close the shared Anthropic HTTP client, if one was created."""
+    global _anthropic_http_client
+    if _anthropic_http_client is not None:
+        client, _anthropic_http_client = _anthropic_http_client, None
+        await client.aclose()
+
 
 @dataclass
 class LLMResponse:
@@ -91,7 +131,8 @@ class ClaudeClient:
                 import anthropic
 
                 self._client = anthropic.AsyncAnthropic(
-                    api_key=self.settings.anthropic_api_key.get_secret_value()
+                    api_key=self.settings.anthropic_api_key.get_secret_value(),
+                    http_client=get_anthropic_http_client(),
                 )
             except ImportError:
                 raise RuntimeError("anthropic package not installed")
@@ -1,14 +1,19 @@
 """Next Steps Engine - Track and manage project action items."""
 
 import uuid
+from collections import Counter, defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from wowasi_ya.models.document import DocumentType
 from wowasi_ya.models.next_steps import (
+    TEMPLATE_BY_ID,
+    TEMPLATES_BY_DOC_TYPE,
     ActionType,
-    NEXT_STEP_TEMPLATES,
     NextStepTemplate,
     OutlineMapping,
     ProjectNextStep,
@@ -16,6 +21,63 @@ from wowasi_ya.models.next_steps import (
     StepStatus,
 )
 
+# Serializes steps straight to JSON bytes for the JSONL store
+_STEP_ADAPTER = TypeAdapter(ProjectNextStep)
+
+# OutlineMapping is a plain dataclass; this adapter handles its JSON lines
+_MAPPING_ADAPTER = TypeAdapter(OutlineMapping)
+
+
+def build_progress(project_id: str, steps: Sequence[ProjectNextStep]) -> ProjectProgress:
+    """Aggregate step statuses into a progress snapshot in a single pass.
+
+    Args:
+        project_id: The project ID.
+        steps: All next steps for the project.
+
+    Returns:
+        Overall and per-document-type progress.
+    """
+    by_status: Counter[StepStatus] = Counter()
+    by_doc_type: defaultdict[DocumentType, Counter[StepStatus]] = defaultdict(Counter)
+    required_total = required_completed = 0
+    for step in steps:
+        by_status[step.status] += 1
+        by_doc_type[step.document_type][step.status] += 1
+        if step.is_required:
+            required_total += 1
+            if step.status == StepStatus.COMPLETED:
+                required_completed += 1
+
+    total = len(steps)
+    # Completed and skipped steps both count as done
+    done = by_status[StepStatus.COMPLETED] + by_status[StepStatus.SKIPPED]
+    percentage = (done / total * 100) if total > 0 else 0.0
+
+    # Counts come straight from the steps, so skip revalidation
+    return ProjectProgress.model_construct(
+        project_id=project_id,
+        total_steps=total,
+        completed_steps=by_status[StepStatus.COMPLETED],
+        in_progress_steps=by_status[StepStatus.IN_PROGRESS],
+        skipped_steps=by_status[StepStatus.SKIPPED],
+        not_started_steps=by_status[StepStatus.NOT_STARTED],
+        completion_percentage=round(percentage, 1),
+        required_steps_total=required_total,
+        required_steps_completed=required_completed,
+        by_document_type={
+            doc_type.value: {
+                "total": counts.total(),
+                "completed": counts[StepStatus.COMPLETED],
+                "in_progress": counts[StepStatus.IN_PROGRESS],
+                "skipped": counts[StepStatus.SKIPPED],
+                "not_started": counts[StepStatus.NOT_STARTED],
+            }
+            for doc_type in DocumentType
+            if (counts := by_doc_type.get(doc_type))
+        },
+    )
+
 
 class NextStepsStore:
     """Persistent storage for project next steps.
@@ -45,24 +107,22 @@ class NextStepsStore:
         if not self.storage_path.exists():
             return
 
-        with self.storage_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        for line in self.storage_path.read_bytes().splitlines():
+            if not line.strip():
+                continue
 
-                try:
-                    step = ProjectNextStep.model_validate_json(line)
-                    self._steps[step.id] = step
-                except Exception as e:
-                    print(f"Warning: Failed to load next step: {e}")
-                    continue
+            try:
+                step = _STEP_ADAPTER.validate_json(line)
+                self._steps[step.id] = step
+            except Exception as e:
+                print(f"Warning: Failed to load next step: {e}")
+                continue
 
     def _save_all(self) -> None:
         """Write all steps to disk."""
-        with self.storage_path.open("w", encoding="utf-8") as f:
-            for step in self._steps.values():
-                f.write(step.model_dump_json() + "\n")
+        self.storage_path.write_bytes(
+            b"".join(_STEP_ADAPTER.dump_json(step) + b"\n" for step in self._steps.values())
+        )
 
     def get(self, step_id: str) -> ProjectNextStep | None:
         """Get a next step by ID."""
@@ -91,10 +151,8 @@ class NextStepsStore:
 
     def _get_template_order(self, template_id: str) -> int:
         """Get the step order from template ID."""
-        for template in NEXT_STEP_TEMPLATES:
-            if template["id"] == template_id:
-                return template["step_order"]
-        return 999
+        template = TEMPLATE_BY_ID.get(template_id)
+        return template.step_order if template else 999
 
     def save(self, step: ProjectNextStep) -> None:
         """Save or update a next step."""
@@ -104,8 +162,9 @@ class NextStepsStore:
 
     def save_many(self, steps: list[ProjectNextStep]) -> None:
         """Save multiple next steps at once."""
+        now = datetime.utcnow()
         for step in steps:
-            step.updated_at = datetime.utcnow()
+            step.updated_at = now
             self._steps[step.id] = step
         self._save_all()
 
@@ -158,7 +217,7 @@ class OutlineMappingStore:
                     continue
 
                 try:
-                    mapping = OutlineMapping.model_validate_json(line)
+                    mapping = _MAPPING_ADAPTER.validate_json(line)
                     self._mappings[mapping.project_id] = mapping
                 except Exception as e:
                     print(f"Warning: Failed to load outline mapping: {e}")
@@ -168,7 +227,7 @@ class OutlineMappingStore:
         """Write all mappings to disk."""
         with self.storage_path.open("w", encoding="utf-8") as f:
             for mapping in self._mappings.values():
-                f.write(mapping.model_dump_json() + "\n")
+                f.write(_MAPPING_ADAPTER.dump_json(mapping).decode() + "\n")
 
     def get_by_project(self, project_id: str) -> OutlineMapping | None:
         """Get mapping for a project."""
@@ -205,23 +264,16 @@ class NextStepsEngine:
         """Initialize the next steps engine."""
         self._steps_store = steps_store or get_steps_store()
         self._mapping_store = mapping_store or get_mapping_store()
-        self._templates = self._load_templates()
-
-    def _load_templates(self) -> dict[str, NextStepTemplate]:
-        """Load predefined templates into a dict."""
-        return {
-            t["id"]: NextStepTemplate(**t)
-            for t in NEXT_STEP_TEMPLATES
-        }
+        self._templates = TEMPLATE_BY_ID
 
     def get_templates(
         self,
         document_type: DocumentType | None = None,
     ) -> list[NextStepTemplate]:
         """Get all templates, optionally filtered by document type."""
-        templates = list(self._templates.values())
         if document_type:
-            templates = [t for t in templates if t.document_type == document_type]
+            return list(TEMPLATES_BY_DOC_TYPE[document_type])
+        templates = list(self._templates.values())
         return sorted(templates, key=lambda t: (t.document_type.value, t.step_order))
 
     def create_steps_for_project(
@@ -239,25 +291,17 @@ class NextStepsEngine:
         Returns:
             List of created ProjectNextStep instances.
         """
-        if document_types is None:
-            document_types = list(DocumentType)
-
-        steps: list[ProjectNextStep] = []
-        for template in self._templates.values():
-            if template.document_type in document_types:
-                step = ProjectNextStep(
-                    id=str(uuid.uuid4()),
-                    project_id=project_id,
-                    template_id=template.id,
-                    document_type=template.document_type,
-                    title=template.title,
-                    description=template.description,
-                    action_type=template.action_type,
-                    action_config=template.action_config.copy(),
-                    is_required=template.is_required,
-                    status=StepStatus.NOT_STARTED,
-                )
-                steps.append(step)
+        # Set membership per template instead of scanning the requested list
+        wanted = frozenset(DocumentType if document_types is None else document_types)
+        # One timestamp for the whole batch
+        now = datetime.utcnow()
+
+        # Templates are trusted module data, so steps skip revalidation
+        steps = [
+            ProjectNextStep.from_template(project_id, template, now)
+            for template in self._templates.values()
+            if template.document_type in wanted
+        ]
 
         # Save all at once
         self._steps_store.save_many(steps)
@@ -355,49 +399,7 @@ class NextStepsEngine:
 
     def get_progress(self, project_id: str) -> ProjectProgress:
         """Calculate progress for a project."""
-        steps = self._steps_store.get_by_project(project_id)
-
-        total = len(steps)
-        completed = sum(1 for s in steps if s.status == StepStatus.COMPLETED)
-        in_progress = sum(1 for s in steps if s.status == StepStatus.IN_PROGRESS)
-        skipped = sum(1 for s in steps if s.status == StepStatus.SKIPPED)
-        not_started = sum(1 for s in steps if s.status == StepStatus.NOT_STARTED)
-
-        required_total = sum(1 for s in steps if s.is_required)
-        required_completed = sum(
-            1 for s in steps
-            if s.is_required and s.status == StepStatus.COMPLETED
-        )
-
-        # Calculate percentage (counting completed and skipped as "done")
-        done = completed + skipped
-        percentage = (done / total * 100) if total > 0 else 0
-
-        # Progress by document type
-        by_doc_type: dict[str, dict[str, int]] = {}
-        for doc_type in DocumentType:
-            doc_steps = [s for s in steps if s.document_type == doc_type]
-            if doc_steps:
-                by_doc_type[doc_type.value] = {
-                    "total": len(doc_steps),
-                    "completed": sum(1 for s in doc_steps if s.status == StepStatus.COMPLETED),
-                    "in_progress": sum(1 for s in doc_steps if s.status == StepStatus.IN_PROGRESS),
-                    "skipped": sum(1 for s in doc_steps if s.status == StepStatus.SKIPPED),
-                    "not_started": sum(1 for s in doc_steps if s.status == StepStatus.NOT_STARTED),
-                }
-
-        return ProjectProgress(
-            project_id=project_id,
-            total_steps=total,
-            completed_steps=completed,
-            in_progress_steps=in_progress,
-            skipped_steps=skipped,
-            not_started_steps=not_started,
-            completion_percentage=round(percentage, 1),
-            required_steps_total=required_total,
-            required_steps_completed=required_completed,
-            by_document_type=by_doc_type,
-        )
+        return build_progress(project_id, self._steps_store.get_by_project(project_id))
 
     def save_outline_mapping(
         self,
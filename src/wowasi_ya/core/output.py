@@ -1,13 +1,47 @@
 """Output Manager - Write generated documents to various destinations."""
 
+import os
+import re
 import subprocess
+import tarfile
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from wowasi_ya.config import Settings, get_settings
 from wowasi_ya.models.document import GeneratedProject
 
+# Standard project folder structure
+_FOLDERS = ("00-Overview", "10-Discovery", "20-Planning", "30-Execution", "40-Comms", "90-Archive")
+
+# Write relative to an open folder fd where the platform supports it
+_USE_DIR_FD = os.open in os.supports_dir_fd
+
+# Many small files are latency-bound on Drive API calls, so run more of them at once
+_RCLONE_PARALLEL_FLAGS = ("--transfers", "16", "--checkers", "32", "--fast-list")
+
+# Characters not allowed in file and folder names
+_INVALID_NAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# Markdown links to other documents: [text](file.md)
+_MD_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+\.md)\)")
+
+
+def _replace_md_link(match: re.Match[str]) -> str:
+    """Render a markdown document link as an Obsidian wiki link."""
+    text = match.group(1)
+    file = match.group(2)
+    if file.endswith(".md"):
+        file = file[:-3]  # Remove .md extension
+    return f"[[{file}|{text}]]"
+
+
+@lru_cache(maxsize=512)
+def _sanitize_name(name: str) -> str:
+    """Sanitize project name for filesystem use."""
+    return name.translate(_INVALID_NAME_CHARS).strip()
+
 
 class OutputWriter(ABC):
     """Abstract base class for output writers."""
@@ -29,35 +63,65 @@ class OutputWriter(ABC):
 class FilesystemWriter(OutputWriter):
     """Write documents to the local filesystem."""
 
+    def __init__(self, encoded_content: dict[str, bytes] | None = None) -> None:
+        """Initialize the filesystem writer.
+
+        Args:
+            encoded_content: Optional UTF-8 document bodies keyed by filename,
+                shared across writers so each document is encoded only once.
+        """
+        self.encoded_content = encoded_content or {}
+
     async def write(self, project: GeneratedProject, destination: Path) -> list[str]:
         """Write documents to filesystem maintaining folder structure."""
         paths: list[str] = []
 
         # Create project directory
-        project_dir = destination / self._sanitize_name(project.project_name)
+        project_dir = destination / _sanitize_name(project.project_name)
         project_dir.mkdir(parents=True, exist_ok=True)
 
         # Create folder structure
-        folders = {"00-Overview", "10-Discovery", "20-Planning", "30-Execution", "40-Comms", "90-Archive"}
-        for folder in folders:
+        for folder in _FOLDERS:
             (project_dir / folder).mkdir(exist_ok=True)
 
-        # Write each document
-        for doc in project.documents:
-            doc_path = project_dir / doc.folder / doc.filename
-            doc_path.write_text(doc.content, encoding="utf-8")
-            paths.append(str(doc_path))
+        # Open each folder once so files are created relative to it
+        folder_fds: dict[str, int] = {}
+        try:
+            # Write each document
+            for doc in project.documents:
+                content_bytes = self.encoded_content.get(doc.filename)
+                if content_bytes is None:
+                    content_bytes = doc.content.encode("utf-8")
+
+                folder_path = project_dir / doc.folder
+                doc_path = folder_path / doc.filename
+
+                if _USE_DIR_FD:
+                    folder_fd = folder_fds.get(doc.folder)
+                    if folder_fd is None:
+                        folder_fd = os.open(folder_path, os.O_RDONLY | os.O_DIRECTORY)
+                        folder_fds[doc.folder] = folder_fd
+                    self._write_at(folder_fd, doc.filename, content_bytes)
+                else:
+                    doc_path.write_bytes(content_bytes)
+
+                paths.append(str(doc_path))
+        finally:
+            for folder_fd in folder_fds.values():
+                os.close(folder_fd)
 
         return paths
 
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize project name for filesystem use."""
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = name
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, "_")
-        return sanitized.strip()
+    def _write_at(self, folder_fd: int, filename: str, data: bytes) -> None:
+        """Write a file relative to an open folder descriptor."""
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=folder_fd)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
 
 
 class ObsidianWriter(OutputWriter):
@@ -79,12 +143,11 @@ class ObsidianWriter(OutputWriter):
         area_dir = self.vault_path / project.project_area
         area_dir.mkdir(parents=True, exist_ok=True)
 
-        project_dir = area_dir / self._sanitize_name(project.project_name)
+        project_dir = area_dir / _sanitize_name(project.project_name)
         project_dir.mkdir(parents=True, exist_ok=True)
 
         # Create folder structure
-        folders = {"00-Overview", "10-Discovery", "20-Planning", "30-Execution", "40-Comms", "90-Archive"}
-        for folder in folders:
+        for folder in _FOLDERS:
             (project_dir / folder).mkdir(exist_ok=True)
 
         # Write each document with Obsidian frontmatter
@@ -98,14 +161,6 @@ class ObsidianWriter(OutputWriter):
 
         return paths
 
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize project name for filesystem use."""
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = name
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, "_")
-        return sanitized.strip()
-
     def _add_frontmatter(self, content: str, title: str, project: str) -> str:
         """Add YAML frontmatter for Obsidian."""
         frontmatter = f"""---
@@ -122,38 +177,40 @@ tags:
 
     def _convert_links(self, content: str, project: GeneratedProject) -> str:
         """Convert markdown links to Obsidian wiki-style links."""
-        import re
+        # Most documents have no links at all - skip the regex pass
+        if "](" not in content:
+            return content
 
         # Convert [text](file.md) to [[file|text]]
-        def replace_link(match: re.Match[str]) -> str:
-            text = match.group(1)
-            file = match.group(2)
-            if file.endswith(".md"):
-                file = file[:-3]  # Remove .md extension
-            return f"[[{file}|{text}]]"
-
-        return re.sub(r"\[([^\]]+)\]\(([^)]+\.md)\)", replace_link, content)
+        return _MD_LINK_PATTERN.sub(_replace_md_link, content)
 
 
 class GitWriter(OutputWriter):
     """Write documents to a Git repository."""
 
-    def __init__(self, repo_path: Path, auto_commit: bool = True) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        auto_commit: bool = True,
+        encoded_content: dict[str, bytes] | None = None,
+    ) -> None:
         """Initialize with Git repository path.
 
         Args:
             repo_path: Path to Git repository.
             auto_commit: Whether to automatically commit changes.
+            encoded_content: Optional pre-encoded document bodies keyed by filename.
         """
         self.repo_path = repo_path
         self.auto_commit = auto_commit
+        self.encoded_content = encoded_content
 
     async def write(self, project: GeneratedProject, destination: Path) -> list[str]:
         """Write documents to Git repository and optionally commit."""
         paths: list[str] = []
 
         # Use filesystem writer for actual file creation
-        fs_writer = FilesystemWriter()
+        fs_writer = FilesystemWriter(self.encoded_content)
         paths = await fs_writer.write(project, self.repo_path)
 
         if self.auto_commit and paths:
@@ -165,20 +222,23 @@ class GitWriter(OutputWriter):
         """Create a Git commit for the generated documents."""
         try:
             # Add all changes
+            # Output is never read, so discard it rather than piping it back
             subprocess.run(
-                ["git", "add", "."],
+                ["git", "add", "-A", "--", "."],
                 cwd=self.repo_path,
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             # Commit
             commit_msg = f"Generated {doc_count} documents for: {project_name}\n\nGenerated by Wowasi_ya"
             subprocess.run(
-                ["git", "commit", "-m", commit_msg],
+                ["git", "commit", "--quiet", "-m", commit_msg],
                 cwd=self.repo_path,
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
         except subprocess.CalledProcessError:
             # Git operations failed - continue without commit
@@ -188,15 +248,26 @@ class GitWriter(OutputWriter):
 class GoogleDriveWriter(OutputWriter):
     """Write documents to Google Drive via rclone."""
 
-    def __init__(self, remote_path: str = "gdrive:Wowasi", local_cache: Path | None = None) -> None:
+    def __init__(
+        self,
+        remote_path: str = "gdrive:Wowasi",
+        local_cache: Path | None = None,
+        encoded_content: dict[str, bytes] | None = None,
+        archive_threshold: int = 0,
+    ) -> None:
         """Initialize with Google Drive remote path.
 
         Args:
             remote_path: Rclone remote path (e.g., "gdrive:Wowasi").
             local_cache: Optional local cache directory (defaults to ./output).
+            encoded_content: Optional pre-encoded document bodies keyed by filename.
+            archive_threshold: Upload a single archive instead of individual files
+                when the project has more documents than this (0 disables).
         """
         self.remote_path = remote_path
         self.local_cache = local_cache or Path("./output")
+        self.encoded_content = encoded_content
+        self.archive_threshold = archive_threshold
 
     async def write(self, project: GeneratedProject, destination: Path) -> list[str]:
         """Write documents to Google Drive via rclone sync.
@@ -206,12 +277,16 @@ class GoogleDriveWriter(OutputWriter):
         paths: list[str] = []
 
         # Write to local cache first
-        fs_writer = FilesystemWriter()
+        fs_writer = FilesystemWriter(self.encoded_content)
         paths = await fs_writer.write(project, self.local_cache)
 
         # Sync to Google Drive
         if paths:
-            self._sync_to_gdrive(project.project_name, project.project_area)
+            if self.archive_threshold and len(project.documents) > self.archive_threshold:
+                # One Drive upload instead of one API round-trip per file
+                self._upload_archive(project.project_name, project.project_area)
+            else:
+                self._sync_to_gdrive(project.project_name, project.project_area)
 
         return paths
 
@@ -219,7 +294,7 @@ class GoogleDriveWriter(OutputWriter):
         """Sync project directory to Google Drive using rclone."""
         try:
             # Sanitize project name for filesystem
-            sanitized_name = self._sanitize_name(project_name)
+            sanitized_name = _sanitize_name(project_name)
             local_path = self.local_cache / sanitized_name
             # Nest under area folder in Google Drive
             remote_project_path = f"{self.remote_path}/{project_area}/{sanitized_name}"
@@ -235,6 +310,7 @@ class GoogleDriveWriter(OutputWriter):
                     ".DS_Store",
                     "--exclude",
                     "*.tmp",
+                    *_RCLONE_PARALLEL_FLAGS,
                     "--log-level",
                     "INFO",
                 ],
@@ -253,13 +329,45 @@ class GoogleDriveWriter(OutputWriter):
             # rclone not installed
             print("⚠ Warning: rclone not found. Install rclone to enable Google Drive sync.")
 
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize project name for filesystem use."""
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = name
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, "_")
-        return sanitized.strip()
+    def _upload_archive(self, project_name: str, project_area: str = "04_Iyeska") -> None:
+        """Upload the project directory to Google Drive as a single tar.gz archive.
+
+        The archive is streamed straight into `rclone rcat`, so it is never
+        staged on disk or held in memory.
+        """
+        try:
+            sanitized_name = _sanitize_name(project_name)
+            local_path = self.local_cache / sanitized_name
+            remote_archive_path = f"{self.remote_path}/{project_area}/{sanitized_name}.tar.gz"
+
+            process = subprocess.Popen(
+                ["rclone", "rcat", remote_archive_path, "--log-level", "ERROR"],
+                stdin=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+
+            try:
+                # Stream mode ("w|gz") writes sequentially without seeking
+                with tarfile.open(
+                    fileobj=process.stdin, mode="w|gz", bufsize=1 << 20
+                ) as archive:
+                    archive.add(local_path, arcname=sanitized_name)
+            except BrokenPipeError:
+                # rclone exited early - its stderr explains why
+                pass
+
+            _, stderr = process.communicate()
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    process.returncode, process.args, stderr=stderr.decode(errors="replace")
+                )
+
+            print(f"✓ Uploaded archive to Google Drive: {remote_archive_path}")
+
+        except subprocess.CalledProcessError as e:
+            print(f"⚠ Warning: Failed to upload archive to Google Drive: {e.stderr}")
+        except FileNotFoundError:
+            print("⚠ Warning: rclone not found. Install rclone to enable Google Drive sync.")
 
 
 class OutlineWriter(OutputWriter):
@@ -313,12 +421,14 @@ class OutputManager:
         self,
         project: GeneratedProject,
         output_format: str = "filesystem",
+        encoded_content: dict[str, bytes] | None = None,
     ) -> list[str]:
         """Write project to the configured output destination.
 
         Args:
             project: Generated project to write.
             output_format: Output format (filesystem, obsidian, git, gdrive, outline).
+            encoded_content: Optional pre-encoded document bodies keyed by filename.
 
         Returns:
             List of output paths/URLs.
@@ -333,16 +443,18 @@ class OutputManager:
             writer = GoogleDriveWriter(
                 remote_path=self.settings.gdrive_remote_path,
                 local_cache=self.settings.output_dir,
+                encoded_content=encoded_content,
+                archive_threshold=self.settings.gdrive_archive_threshold,
             )
             destination = self.settings.output_dir
         elif output_format == "obsidian" and self.settings.obsidian_vault_path:
             writer = ObsidianWriter(self.settings.obsidian_vault_path)
             destination = self.settings.obsidian_vault_path
         elif output_format == "git" and self.settings.git_output_path:
-            writer = GitWriter(self.settings.git_output_path)
+            writer = GitWriter(self.settings.git_output_path, encoded_content=encoded_content)
             destination = self.settings.git_output_path
         else:
-            writer = FilesystemWriter()
+            writer = FilesystemWriter(encoded_content)
             destination = self.settings.output_dir
 
         # Ensure output directory exists
@@ -367,9 +479,12 @@ class OutputManager:
         formats = formats or ["filesystem"]
         results: dict[str, list[str]] = {}
 
+        # Encode each document once and reuse the bytes for every destination
+        encoded_content = {doc.filename: doc.content.encode("utf-8") for doc in project.documents}
+
         for fmt in formats:
             try:
-                paths = await self.write(project, fmt)
+                paths = await self.write(project, fmt, encoded_content)
                 results[fmt] = paths
             except Exception as e:
                 results[fmt] = [f"Error: {e!s}"]
@@ -1,11 +1,19 @@
 """Privacy Layer - PHI/PII detection and user approval gate."""
 
+import re
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+try:
+    # RE2 matches all fallback patterns in one linear-time DFA pass
+    import re2 as _fallback_re
+except ImportError:
+    _fallback_re = re
+
 
 class SensitiveDataType(str, Enum):
     """Types of sensitive data that can be detected."""
@@ -23,6 +31,21 @@ class SensitiveDataType(str, Enum):
     LOCATION = "LOCATION"
 
 
+# Fallback detectors, combined so a single pass over the text finds every type
+_FALLBACK_PATTERN = _fallback_re.compile(
+    r"(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"
+    r"|(?P<PHONE>\b(?:\+1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b)"
+    r"|(?P<SSN>\b[0-9]{3}[-\s]?[0-9]{2}[-\s]?[0-9]{4}\b)"
+)
+
+# Named group -> (data type, confidence)
+_FALLBACK_KINDS: dict[str, tuple[SensitiveDataType, float]] = {
+    "EMAIL": (SensitiveDataType.EMAIL, 0.95),
+    "PHONE": (SensitiveDataType.PHONE, 0.85),
+    "SSN": (SensitiveDataType.SSN, 0.75),
+}
+
+
 class PrivacyFlag(BaseModel):
     """A detected piece of sensitive information."""
 
@@ -57,6 +80,98 @@ class PrivacyConfig:
         SensitiveDataType.TRIBAL_ID,
     )
     enabled_detectors: tuple[SensitiveDataType, ...] = tuple(SensitiveDataType)
+    chunk_size: int = 4096
+    chunk_overlap: int = 200  # Characters shared by adjacent chunks
+
+
+# Any whitespace character, for snapping chunk starts to a word boundary
+_WHITESPACE = re.compile(r"\s")
+
+
+def _split_paragraph_chunks(
+    text: str, chunk_size: int, overlap: int = 0
+) -> list[tuple[int, str]]:
+    """Split text into roughly chunk_size pieces at paragraph boundaries.
+
+    Breaks after the last blank line in the window, else the last newline,
+    else the last whitespace, so entities are only cut when a single word is
+    longer than chunk_size. Adjacent chunks share up to overlap characters so
+    a multi-word entity near a boundary appears whole in one of them.
+
+    Returns:
+        List of (offset, chunk) pairs, where offset is the chunk's start in text.
+    """
+    chunks: list[tuple[int, str]] = []
+    start = 0
+    length = len(text)
+
+    while start < length:
+        end = start + chunk_size
+        if end >= length:
+            end = length
+        else:
+            boundary = text.rfind("\n\n", start, end)
+            if boundary > start:
+                end = boundary + 2
+            else:
+                boundary = max(text.rfind(c, start, end) for c in (" ", "\t", "\n", "\r"))
+                if boundary > start:
+                    end = boundary + 1
+        chunks.append((start, text[start:end]))
+        if end == length:
+            break
+
+        next_start = end - overlap
+        if next_start <= start:
+            next_start = end
+        elif space := _WHITESPACE.search(text, next_start, end):
+            next_start = space.end()
+        start = next_start
+
+    return chunks
+
+
+def _merge_overlapping_flags(flags: list[PrivacyFlag]) -> list[PrivacyFlag]:
+    """Drop flags repeated by overlapping chunks.
+
+    A flag is dropped when another flag of the same type covers its whole
+    span, which also removes partial matches cut at a chunk edge.
+    """
+    kept: list[PrivacyFlag] = []
+    # Furthest end of any kept flag per type; sorted by start, every kept
+    # flag begins at or before the current one, so reaching its end covers it
+    reach: dict[SensitiveDataType, int] = {}
+    for flag in sorted(flags, key=lambda f: (f.start, -f.end, -f.confidence)):
+        if reach.get(flag.data_type, -1) < flag.end:
+            kept.append(flag)
+            reach[flag.data_type] = flag.end
+    return kept
+
+
+# Process-wide Presidio engines, shared by every PrivacyLayer instance
+_presidio_engines: tuple[Any, Any] | None = None
+_presidio_lock = threading.Lock()
+
+
+def _get_presidio_engines() -> tuple[Any, Any]:
+    """Get the shared Presidio analyzer and anonymizer, loading them once.
+
+    Returns:
+        (analyzer, anonymizer), or (None, None) if Presidio is not installed.
+    """
+    global _presidio_engines
+    if _presidio_engines is None:
+        with _presidio_lock:
+            if _presidio_engines is None:
+                try:
+                    from presidio_analyzer import AnalyzerEngine
+                    from presidio_anonymizer import AnonymizerEngine
+
+                    _presidio_engines = (AnalyzerEngine(), AnonymizerEngine())
+                except ImportError:
+                    # Presidio not installed - use fallback pattern matching
+                    _presidio_engines = (None, None)
+    return _presidio_engines
 
 
 class PrivacyLayer:
@@ -77,18 +192,9 @@ class PrivacyLayer:
         self._anonymizer: Any = None
 
     def _ensure_initialized(self) -> None:
-        """Lazily initialize Presidio analyzers."""
+        """Lazily attach the shared Presidio analyzers."""
         if self._analyzer is None:
-            try:
-                from presidio_analyzer import AnalyzerEngine
-                from presidio_anonymizer import AnonymizerEngine
-
-                self._analyzer = AnalyzerEngine()
-                self._anonymizer = AnonymizerEngine()
-            except ImportError:
-                # Presidio not installed - use fallback pattern matching
-                self._analyzer = None
-                self._anonymizer = None
+            self._analyzer, self._anonymizer = _get_presidio_engines()
 
     def scan(self, text: str) -> PrivacyScanResult:
         """Scan text for sensitive data.
@@ -105,34 +211,43 @@ class PrivacyLayer:
 
         if self._analyzer is not None:
             # Use Presidio for detection
-            results = self._analyzer.analyze(
-                text=text,
-                language="en",
-                score_threshold=self.config.confidence_threshold,
+            # Analyze paragraph-sized chunks to keep NER memory bounded
+            chunks = _split_paragraph_chunks(
+                text, self.config.chunk_size, self.config.chunk_overlap
             )
+            for offset, chunk in chunks:
+                results = self._analyzer.analyze(
+                    text=chunk,
+                    language="en",
+                    score_threshold=self.config.confidence_threshold,
+                )
 
-            for result in results:
-                try:
-                    data_type = SensitiveDataType(result.entity_type)
-                except ValueError:
-                    # Unknown entity type - skip
-                    continue
-
-                # Get context (surrounding text)
-                context_start = max(0, result.start - 20)
-                context_end = min(len(text), result.end + 20)
-                context = text[context_start:context_end]
-
-                flags.append(
-                    PrivacyFlag(
-                        data_type=data_type,
-                        text=text[result.start : result.end],
-                        start=result.start,
-                        end=result.end,
-                        confidence=result.score,
-                        context=f"...{context}...",
+                for result in results:
+                    try:
+                        data_type = SensitiveDataType(result.entity_type)
+                    except ValueError:
+                        # Unknown entity type - skip
+                        continue
+
+                    start = offset + result.start
+                    end = offset + result.end
+
+                    # Get context (surrounding text)
+                    context_start = max(0, start - 20)
+                    context_end = min(len(text), end + 20)
+                    context = text[context_start:context_end]
+
+                    flags.append(
+                        PrivacyFlag(
+                            data_type=data_type,
+                            text=text[start:end],
+                            start=start,
+                            end=end,
+                            confidence=result.score,
+                            context=f"...{context}...",
+                        )
                     )
-                )
+            flags = _merge_overlapping_flags(flags)
         else:
             # Fallback: Use basic pattern matching
             flags = self._fallback_scan(text)
@@ -157,48 +272,17 @@ class PrivacyLayer:
 
     def _fallback_scan(self, text: str) -> list[PrivacyFlag]:
         """Basic pattern matching fallback when Presidio is not available."""
-        import re
-
         flags: list[PrivacyFlag] = []
 
-        # Email pattern
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        for match in re.finditer(email_pattern, text):
-            flags.append(
-                PrivacyFlag(
-                    data_type=SensitiveDataType.EMAIL,
-                    text=match.group(),
-                    start=match.start(),
-                    end=match.end(),
-                    confidence=0.95,
-                    context=text[max(0, match.start() - 20) : match.end() + 20],
-                )
-            )
-
-        # Phone pattern (US)
-        phone_pattern = r"\b(?:\+1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b"
-        for match in re.finditer(phone_pattern, text):
+        for match in _FALLBACK_PATTERN.finditer(text):
+            data_type, confidence = _FALLBACK_KINDS[match.lastgroup or ""]
             flags.append(
                 PrivacyFlag(
-                    data_type=SensitiveDataType.PHONE,
+                    data_type=data_type,
                     text=match.group(),
                     start=match.start(),
                     end=match.end(),
-                    confidence=0.85,
-                    context=text[max(0, match.start() - 20) : match.end() + 20],
-                )
-            )
-
-        # SSN pattern
-        ssn_pattern = r"\b[0-9]{3}[-\s]?[0-9]{2}[-\s]?[0-9]{4}\b"
-        for match in re.finditer(ssn_pattern, text):
-            flags.append(
-                PrivacyFlag(
-                    data_type=SensitiveDataType.SSN,
-                    text=match.group(),
-                    start=match.start(),
-                    end=match.end(),
-                    confidence=0.75,
+                    confidence=confidence,
                     context=text[max(0, match.start() - 20) : match.end() + 20],
                 )
             )
@@ -210,15 +294,20 @@ class PrivacyLayer:
         if not flags:
             return text
 
-        # Sort flags by position (reverse) to replace from end to start
-        sorted_flags = sorted(flags, key=lambda f: f.start, reverse=True)
-
-        sanitized = text
-        for flag in sorted_flags:
-            placeholder = f"[{flag.data_type.value}]"
-            sanitized = sanitized[: flag.start] + placeholder + sanitized[flag.end :]
-
-        return sanitized
+        # Walk flags in position order, copying the untouched text between them
+        parts: list[str] = []
+        cursor = 0
+        for flag in sorted(flags, key=lambda f: f.start):
+            if flag.start < cursor:
+                # Overlaps a span that was already replaced
+                cursor = max(cursor, flag.end)
+                continue
+            parts.append(text[cursor : flag.start])
+            parts.append(f"[{flag.data_type.value}]")
+            cursor = flag.end
+        parts.append(text[cursor:])
+
+        return "".join(parts)
 
     def approve(self, scan_result: PrivacyScanResult) -> PrivacyScanResult:
         """Mark a scan result as approved by user.
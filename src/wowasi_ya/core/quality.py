@@ -1,10 +1,56 @@
 """Quality Checker - Phase 3: Local cross-reference validation."""
 
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 
 from wowasi_ya.models.document import Document, GeneratedProject
 
+# Leading whitespace then a heading marker, matched without copying the document
+_TITLE_PATTERN = re.compile(r"\s*#")
+
+# A heading line (optionally indented) and any non-whitespace character
+_HEADING_LINE_PATTERN = re.compile(r"^[^\S\n]*(#[^\n]*)$", re.MULTILINE)
+_NON_BLANK_PATTERN = re.compile(r"\S")
+
+# Placeholder text that should never survive into a generated document
+_PLACEHOLDERS = (
+    "[TODO]",
+    "[PLACEHOLDER]",
+    "[INSERT]",
+    "[TBD]",
+    "Lorem ipsum",
+    "XXX",
+    "FIXME",
+)
+
+# (lowercased, display) pairs, in report order
+_PLACEHOLDERS_LOWER = tuple((p.lower(), p) for p in _PLACEHOLDERS)
+
+# All placeholders in one case-insensitive pattern, so each line is scanned once
+_PLACEHOLDER_PATTERN = re.compile(
+    "|".join(re.escape(p) for p in _PLACEHOLDERS),
+    re.IGNORECASE,
+)
+
+# Glossary terms are **Term** or ## Term; one pass finds both forms
+_BOLD_TERM_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_GLOSSARY_TERM_PATTERN = re.compile(r"^##\s+(.+)$|\*\*([^*]+)\*\*", re.MULTILINE)
+
+# Acronyms that may need a glossary entry
+_ACRONYM_PATTERN = re.compile(r"\b[A-Z]{2,}\b")
+
+# Acronyms readers are expected to know already
+_COMMON_ACRONYMS = frozenset(
+    {"API", "UI", "URL", "HTTP", "HTTPS", "SQL", "PDF", "CSV", "JSON", "XML"}
+)
+
+# Stakeholder sections in Stakeholder-Notes.md
+_STAKEHOLDER_HEADING_PATTERN = re.compile(r"##\s+(.+)")
+
 
 class IssueSeverity(str, Enum):
     """Severity levels for quality issues."""
@@ -14,7 +60,7 @@ class IssueSeverity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityIssue:
     """A quality issue found during validation."""
 
@@ -25,6 +71,25 @@ class QualityIssue:
     suggestion: str | None = None
 
 
+# Number of per-document results QualityChecker keeps
+_DOCUMENT_CACHE_SIZE = 128
+
+# Report sections: severity, label, rich color, max issues listed
+_REPORT_SECTIONS = (
+    (IssueSeverity.ERROR, "Errors", "red", 5),
+    (IssueSeverity.WARNING, "Warnings", "yellow", 5),
+    (IssueSeverity.INFO, "Info", "blue", 3),
+)
+
+
+def _index_documents(project: GeneratedProject) -> dict[str, Document]:
+    """Map filenames to documents, keeping the first of any duplicates."""
+    docs_by_name: dict[str, Document] = {}
+    for doc in project.documents:
+        docs_by_name.setdefault(doc.filename, doc)
+    return docs_by_name
+
+
 class QualityChecker:
     """Quality validation for generated documents.
 
@@ -36,6 +101,22 @@ class QualityChecker:
         """Initialize the quality checker."""
         self.min_word_count = 100
         self.max_word_count = 10000
+        # Results for unchanged documents, reused across regenerations
+        self._document_cache: OrderedDict[tuple[str, int, int, int], list[QualityIssue]] = (
+            OrderedDict()
+        )
+        self._glossary_cache: tuple[tuple[int, int] | None, frozenset[str]] | None = None
+
+    def _document_key(self, doc: Document) -> tuple[str, int, int, int]:
+        """Cache key for a document's check results."""
+        return (doc.filename, len(doc.content), hash(doc.content), doc.word_count)
+
+    def _remember(self, key: tuple[str, int, int, int], issues: list[QualityIssue]) -> None:
+        """Store check results, evicting the least recently used entry if full."""
+        self._document_cache[key] = issues
+        self._document_cache.move_to_end(key)
+        if len(self._document_cache) > _DOCUMENT_CACHE_SIZE:
+            self._document_cache.popitem(last=False)
 
     def check_document(self, doc: Document) -> list[QualityIssue]:
         """Check a single document for quality issues.
@@ -46,6 +127,18 @@ class QualityChecker:
         Returns:
             List of quality issues found.
         """
+        key = self._document_key(doc)
+        cached = self._document_cache.get(key)
+        if cached is not None:
+            self._document_cache.move_to_end(key)
+            return list(cached)
+
+        issues = self._run_document_checks(doc)
+        self._remember(key, issues)
+        return list(issues)
+
+    def _run_document_checks(self, doc: Document) -> list[QualityIssue]:
+        """Run every single-document check without consulting the cache."""
         issues: list[QualityIssue] = []
 
         # Check word count
@@ -69,7 +162,7 @@ class QualityChecker:
             )
 
         # Check for title
-        if not doc.content.strip().startswith("#"):
+        if not _TITLE_PATTERN.match(doc.content):
             issues.append(
                 QualityIssue(
                     document=doc.filename,
@@ -87,77 +180,82 @@ class QualityChecker:
 
         return issues
 
-    def _check_empty_sections(self, doc: Document) -> list[QualityIssue]:
+    def _check_empty_sections(self, doc: Document) -> Iterator[QualityIssue]:
         """Check for empty sections in a document."""
-        issues: list[QualityIssue] = []
-        lines = doc.content.split("\n")
-
-        current_heading = None
-        content_after_heading = False
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            if stripped.startswith("#"):
-                if current_heading and not content_after_heading:
-                    issues.append(
-                        QualityIssue(
-                            document=doc.filename,
-                            severity=IssueSeverity.WARNING,
-                            message=f"Empty section: {current_heading}",
-                            line=i,
-                            suggestion="Add content or remove the empty section",
-                        )
-                    )
-                current_heading = stripped
-                content_after_heading = False
-            elif stripped and current_heading:
-                content_after_heading = True
-
-        return issues
+        content = doc.content
+
+        # No headings means no sections - skip the regex scan
+        if "#" not in content:
+            return
+
+        current_heading: str | None = None
+        section_start = 0
+        line_number = 0
+        line_counted_to = 0
+
+        # Jump from heading to heading; a section is empty if only whitespace
+        # lies between its heading and the next one
+        for match in _HEADING_LINE_PATTERN.finditer(content):
+            line_number += content.count("\n", line_counted_to, match.start())
+            line_counted_to = match.start()
+
+            if current_heading and not _NON_BLANK_PATTERN.search(
+                content, section_start, match.start()
+            ):
+                yield QualityIssue(
+                    document=doc.filename,
+                    severity=IssueSeverity.WARNING,
+                    message=f"Empty section: {current_heading}",
+                    line=line_number,
+                    suggestion="Add content or remove the empty section",
+                )
+            current_heading = match.group(1).rstrip()
+            section_start = match.end()
 
-    def _check_placeholders(self, doc: Document) -> list[QualityIssue]:
+    def _check_placeholders(self, doc: Document) -> Iterator[QualityIssue]:
         """Check for placeholder text that wasn't replaced."""
-        issues: list[QualityIssue] = []
-        placeholders = [
-            "[TODO]",
-            "[PLACEHOLDER]",
-            "[INSERT]",
-            "[TBD]",
-            "Lorem ipsum",
-            "XXX",
-            "FIXME",
-        ]
-
-        lines = doc.content.split("\n")
-        for i, line in enumerate(lines):
-            for placeholder in placeholders:
-                if placeholder.lower() in line.lower():
-                    issues.append(
-                        QualityIssue(
-                            document=doc.filename,
-                            severity=IssueSeverity.ERROR,
-                            message=f"Placeholder text found: {placeholder}",
-                            line=i + 1,
-                            suggestion="Replace placeholder with actual content",
-                        )
+        content = doc.content
+
+        # Scan the whole document once, grouping hits by line number
+        found_by_line: dict[int, set[str]] = {}
+        line_number = 1
+        line_counted_to = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(content):
+            line_number += content.count("\n", line_counted_to, match.start())
+            line_counted_to = match.start()
+            found_by_line.setdefault(line_number, set()).add(match.group().lower())
+
+        for line_number, found in found_by_line.items():
+            for lowered, placeholder in _PLACEHOLDERS_LOWER:
+                if lowered in found:
+                    yield QualityIssue(
+                        document=doc.filename,
+                        severity=IssueSeverity.ERROR,
+                        message=f"Placeholder text found: {placeholder}",
+                        line=line_number,
+                        suggestion="Replace placeholder with actual content",
                     )
 
-        return issues
-
-    def check_cross_references(self, project: GeneratedProject) -> list[QualityIssue]:
+    def check_cross_references(
+        self,
+        project: GeneratedProject,
+        docs_by_name: dict[str, Document] | None = None,
+    ) -> list[QualityIssue]:
         """Check cross-references between documents.
 
         Args:
             project: Complete generated project.
+            docs_by_name: Optional filename -> document index of the project.
 
         Returns:
             List of cross-reference issues.
         """
         issues: list[QualityIssue] = []
+        if docs_by_name is None:
+            docs_by_name = _index_documents(project)
 
-        # Build glossary terms if available
-        glossary_terms = self._extract_glossary_terms(project)
+        # Acronyms that need no glossary entry: common ones plus defined terms
+        known_terms = self._known_terms(docs_by_name.get("Glossary.md"))
 
         # Check for undefined terms used in documents
         for doc in project.documents:
@@ -165,7 +263,7 @@ class QualityChecker:
                 continue
 
             # Look for terms that might need glossary entries
-            undefined = self._find_undefined_terms(doc, glossary_terms)
+            undefined = self._find_undefined_terms(doc, known_terms)
             for term in undefined:
                 issues.append(
                     QualityIssue(
@@ -177,70 +275,81 @@ class QualityChecker:
                 )
 
         # Check stakeholder consistency
-        issues.extend(self._check_stakeholder_consistency(project))
+        issues.extend(
+            self._check_stakeholder_consistency(docs_by_name.get("Stakeholder-Notes.md"))
+        )
 
         return issues
 
-    def _extract_glossary_terms(self, project: GeneratedProject) -> set[str]:
+    def _known_terms(self, glossary: Document | None) -> frozenset[str]:
+        """Get common acronyms plus uppercased glossary terms.
+
+        Reused while the glossary is unchanged.
+        """
+        key = None if glossary is None else (len(glossary.content), hash(glossary.content))
+        if self._glossary_cache is None or self._glossary_cache[0] != key:
+            terms = self._extract_glossary_terms(glossary)
+            known = _COMMON_ACRONYMS.union(t.upper() for t in terms)
+            self._glossary_cache = (key, known)
+        return self._glossary_cache[1]
+
+    def _extract_glossary_terms(self, glossary: Document | None) -> set[str]:
         """Extract defined terms from the glossary document."""
         terms: set[str] = set()
+        if glossary is None:
+            return terms
+
+        # Simple extraction: look for **Term** or ## Term patterns
+        for match in _GLOSSARY_TERM_PATTERN.finditer(glossary.content):
+            heading, bold = match.groups()
+            if heading is None:
+                terms.add(bold.lower())
+                continue
 
-        for doc in project.documents:
-            if doc.filename == "Glossary.md":
-                # Simple extraction: look for **Term** or ## Term patterns
-                import re
-
-                bold_terms = re.findall(r"\*\*([^*]+)\*\*", doc.content)
-                heading_terms = re.findall(r"^##\s+(.+)$", doc.content, re.MULTILINE)
-                terms.update(t.lower() for t in bold_terms + heading_terms)
-                break
+            terms.add(heading.lower())
+            # A heading consumes any bold terms on its line
+            terms.update(t.lower() for t in _BOLD_TERM_PATTERN.findall(heading))
 
         return terms
 
-    def _find_undefined_terms(self, doc: Document, glossary_terms: set[str]) -> list[str]:
-        """Find potentially undefined technical terms."""
-        # This is a simplified check - could be enhanced with NLP
-        import re
+    def _find_undefined_terms(self, doc: Document, known_terms: frozenset[str]) -> Iterator[str]:
+        """Find potentially undefined technical terms.
 
+        Args:
+            doc: Document to scan.
+            known_terms: Uppercased terms that need no glossary entry.
+        """
+        # This is a simplified check - could be enhanced with NLP
         # Look for capitalized terms or acronyms that might need definition
-        potential_terms = re.findall(r"\b[A-Z]{2,}\b", doc.content)
+        potential_terms = _ACRONYM_PATTERN.findall(doc.content)
         acronyms = set(potential_terms)
 
-        # Filter out common acronyms
-        common = {"API", "UI", "URL", "HTTP", "HTTPS", "SQL", "PDF", "CSV", "JSON", "XML"}
-        undefined = acronyms - common - {t.upper() for t in glossary_terms}
+        # Filter out common acronyms and defined glossary terms
+        undefined = acronyms - known_terms
 
-        return list(undefined)[:5]  # Limit to 5 suggestions
+        yield from islice(undefined, 5)  # Limit to 5 suggestions
 
-    def _check_stakeholder_consistency(self, project: GeneratedProject) -> list[QualityIssue]:
+    def _check_stakeholder_consistency(
+        self, stakeholder_notes: Document | None
+    ) -> Iterator[QualityIssue]:
         """Check that stakeholders are consistently referenced."""
-        issues: list[QualityIssue] = []
-
         # Extract stakeholders from Stakeholder-Notes.md
         stakeholders: set[str] = set()
-        for doc in project.documents:
-            if doc.filename == "Stakeholder-Notes.md":
-                # Simple extraction
-                import re
-
-                matches = re.findall(r"##\s+(.+)", doc.content)
-                stakeholders.update(m.strip().lower() for m in matches)
-                break
+        if stakeholder_notes is not None:
+            # Simple extraction
+            matches = _STAKEHOLDER_HEADING_PATTERN.findall(stakeholder_notes.content)
+            stakeholders.update(m.strip().lower() for m in matches)
 
         # Could add checks for stakeholder references in other documents
         # For now, just verify stakeholder doc exists and has content
         if not stakeholders:
-            issues.append(
-                QualityIssue(
-                    document="Stakeholder-Notes.md",
-                    severity=IssueSeverity.WARNING,
-                    message="No stakeholders identified in Stakeholder Notes",
-                    suggestion="Add stakeholder sections with ## headings",
-                )
+            yield QualityIssue(
+                document="Stakeholder-Notes.md",
+                severity=IssueSeverity.WARNING,
+                message="No stakeholders identified in Stakeholder Notes",
+                suggestion="Add stakeholder sections with ## headings",
             )
 
-        return issues
-
     def check_project(self, project: GeneratedProject) -> list[QualityIssue]:
         """Run all quality checks on a project.
 
@@ -256,8 +365,8 @@ class QualityChecker:
         for doc in project.documents:
             all_issues.extend(self.check_document(doc))
 
-        # Check cross-references
-        all_issues.extend(self.check_cross_references(project))
+        # Check cross-references, looking documents up by name
+        all_issues.extend(self.check_cross_references(project, _index_documents(project)))
 
         # Check completeness
         if len(project.documents) < 15:
@@ -289,11 +398,12 @@ class QualityChecker:
         warning_weight = 0.05
         info_weight = 0.01
 
-        deduction = sum(
-            error_weight if i.severity == IssueSeverity.ERROR
-            else warning_weight if i.severity == IssueSeverity.WARNING
-            else info_weight
-            for i in issues
+        # Count each severity once, then apply the weights
+        counts = Counter(i.severity for i in issues)
+        deduction = (
+            counts[IssueSeverity.ERROR] * error_weight
+            + counts[IssueSeverity.WARNING] * warning_weight
+            + counts[IssueSeverity.INFO] * info_weight
         )
 
         return max(0.0, 1.0 - deduction)
@@ -311,39 +421,32 @@ class QualityChecker:
         score = self.get_quality_score(issues)
 
         # Build report
-        lines = []
-        lines.append(f"Documents Generated: {len(project.documents)}/15")
-        lines.append(f"Total Word Count: {project.total_word_count:,}")
-        lines.append(f"Quality Score: {score:.0%}")
-        lines.append("")
-
-        # Group issues by severity
-        errors = [i for i in issues if i.severity == IssueSeverity.ERROR]
-        warnings = [i for i in issues if i.severity == IssueSeverity.WARNING]
-        infos = [i for i in issues if i.severity == IssueSeverity.INFO]
-
-        if errors:
-            lines.append(f"[red]Errors ({len(errors)}):[/red]")
-            for issue in errors[:5]:
-                lines.append(f"  • {issue.document}: {issue.message}")
-            if len(errors) > 5:
-                lines.append(f"  ... and {len(errors) - 5} more")
-            lines.append("")
-
-        if warnings:
-            lines.append(f"[yellow]Warnings ({len(warnings)}):[/yellow]")
-            for issue in warnings[:5]:
-                lines.append(f"  • {issue.document}: {issue.message}")
-            if len(warnings) > 5:
-                lines.append(f"  ... and {len(warnings) - 5} more")
-            lines.append("")
-
-        if infos:
-            lines.append(f"[blue]Info ({len(infos)}):[/blue]")
-            for issue in infos[:3]:
-                lines.append(f"  • {issue.document}: {issue.message}")
-            if len(infos) > 3:
-                lines.append(f"  ... and {len(infos) - 3} more")
+        lines = [
+            f"Documents Generated: {len(project.documents)}/15",
+            f"Total Word Count: {project.total_word_count:,}",
+            f"Quality Score: {score:.0%}",
+            "",
+        ]
+
+        # Group issues by severity in a single pass
+        by_severity: dict[IssueSeverity, list[QualityIssue]] = {
+            severity: [] for severity in IssueSeverity
+        }
+        for issue in issues:
+            by_severity[issue.severity].append(issue)
+
+        # Only severities that have issues get a section
+        for severity, label, color, limit in _REPORT_SECTIONS:
+            section = by_severity[severity]
+            if not section:
+                continue
+
+            lines.append(f"[{color}]{label} ({len(section)}):[/{color}]")
+            lines.extend(f"  • {issue.document}: {issue.message}" for issue in section[:limit])
+            if len(section) > limit:
+                lines.append(f"  ... and {len(section) - limit} more")
+            if severity is not IssueSeverity.INFO:
+                lines.append("")
 
         if not issues:
             lines.append("[green]✓ No quality issues found![/green]")
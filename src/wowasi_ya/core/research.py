@@ -16,148 +16,208 @@ To add a new research provider:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import re
+import time
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from wowasi_ya.config import Settings, get_settings
-from wowasi_ya.models.agent import AgentDefinition, AgentResult
+from wowasi_ya.core.llm_client import get_anthropic_http_client
+from wowasi_ya.models.agent import AGENT_RESULT_ADAPTER, AgentDefinition, AgentResult
 
 logger = logging.getLogger(__name__)
 
+# Section headings in research responses, checked in order so a line naming
+# several sections opens the first one listed
+_SECTION_PATTERNS = (
+    ("findings", re.compile(r"KEY FINDINGS|FINDINGS:", re.IGNORECASE)),
+    ("sources", re.compile(r"SOURCES:|REFERENCES:", re.IGNORECASE)),
+    ("recommendations", re.compile(r"RECOMMENDATIONS:", re.IGNORECASE)),
+)
+
+# Bullet line, capturing the text after the bullet markers
+_BULLET_PATTERN = re.compile(r"[-•*][-•* ]*\s*(.*)")
+
+# Agent whose raw response the generator uses as documentation scaffolding
+_FRAMEWORKS_AGENT_ID = "agent_000_frameworks"
+
+# Attempts after the first for 429/5xx responses; the SDK backs off with
+# jitter and honors retry-after
+_MAX_RETRIES = 3
+
 
 class ResearchConfig(BaseModel):
     """Configuration for research operations."""
 
     max_concurrent_agents: int = Field(default=1, ge=1, le=10)  # Reduced to 1 to avoid Claude rate limits
-    timeout_seconds: int = Field(default=120, ge=30, le=600)
+    timeout_seconds: int = Field(default=1800, ge=30, le=3600)
     enable_web_search: bool = True
     max_search_results: int = Field(default=5, ge=1, le=10)
 
 
-class ResearchEngine:
-    """Engine for executing research agents via Claude API.
-
-    This is Phase 1 - requires API calls (after privacy approval).
+class _RateLimiter:
+    """Token bucket limiting how many calls start within a time period.
 
-    Provider: Claude API (fixed for now)
-    Reason: Web search capability required
+    Slots are reserved synchronously before sleeping, so the limiter holds no
+    event-loop-bound primitives and can be shared across loops.
     """
 
-    def __init__(
-        self,
-        settings: Settings | None = None,
-        config: ResearchConfig | None = None,
-    ) -> None:
-        """Initialize the research engine.
+    def __init__(self, max_rate: int, time_period: float = 60.0) -> None:
+        """Initialize the limiter.
 
         Args:
-            settings: Application settings (for API key).
-            config: Research-specific configuration.
+            max_rate: Maximum number of calls per time period.
+            time_period: Length of the period in seconds.
         """
-        self.settings = settings or get_settings()
-        # Use settings value if no custom config provided
-        if config is None:
-            config = ResearchConfig(
-                max_concurrent_agents=self.settings.max_concurrent_research_agents
-            )
-        self.config = config
-        self._client: Any = None
+        self._interval = time_period / max_rate
+        self._burst = time_period - self._interval
+        self._next_slot = 0.0
 
-    def _ensure_client(self) -> Any:
-        """Lazily initialize the Anthropic async client."""
-        if self._client is None:
-            try:
-                import anthropic
+    async def acquire(self) -> None:
+        """Wait until a call may start without exceeding the rate."""
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+        delay = slot - self._burst - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-                self._client = anthropic.AsyncAnthropic(
-                    api_key=self.settings.anthropic_api_key.get_secret_value()
-                )
-            except ImportError:
-                raise RuntimeError("anthropic package not installed")
-        return self._client
 
-    async def execute_agent(
-        self,
-        agent: AgentDefinition,
-        project_context: str,
-    ) -> AgentResult:
-        """Execute a single research agent.
+class _SectionParser:
+    """Incremental parser sorting bulleted lines into response sections.
+
+    Text can be fed in arbitrary chunks, such as streamed deltas; each line is
+    parsed as soon as it is complete.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.findings: list[str] = []
+        self.sources: list[str] = []
+        self.recommendations: list[str] = []
+        self._sections: list[tuple[re.Pattern[str], list[str]]] = [
+            (pattern, getattr(self, name)) for name, pattern in _SECTION_PATTERNS
+        ]
+        self._target: list[str] | None = None
+        self._chunks: list[str] = []
+        self._partial = ""
+
+    def feed(self, text: str) -> None:
+        """Parse the complete lines in a chunk of response text.
 
         Args:
-            agent: The agent definition to execute.
-            project_context: Sanitized project context for research.
+            text: Next chunk of response text.
+        """
+        self._chunks.append(text)
+        *lines, self._partial = (self._partial + text).split("\n")
+        for line in lines:
+            self._parse_line(line)
+
+    def close(self) -> str:
+        """Parse any trailing partial line.
 
         Returns:
-            AgentResult with research findings.
+            The full response text fed so far.
         """
-        client = self._ensure_client()
+        self._parse_line(self._partial)
+        self._partial = ""
+        return "".join(self._chunks)
 
-        # Build the research prompt
-        prompt = self._build_research_prompt(agent, project_context)
+    def _parse_line(self, line: str) -> None:
+        """Track section headings and collect bullets under them."""
+        line = line.strip()
+        if not line:
+            return
 
-        # Execute the API call
-        try:
-            # Use web search if enabled
-            tools = []
-            if self.config.enable_web_search and self.settings.enable_web_search:
-                tools = [{"type": "web_search_20250305"}]
-
-            response = await client.messages.create(
-                model=self.settings.claude_model,
-                max_tokens=self.settings.max_generation_tokens,
-                tools=tools if tools else None,
-                messages=[{"role": "user", "content": prompt}],
-            )
+        for pattern, target in self._sections:
+            if pattern.search(line):
+                self._target = target
+                return
+        if self._target is not None and (bullet := _BULLET_PATTERN.match(line)):
+            self._target.append(bullet.group(1))
 
-            # Capture token usage for cost tracking
-            input_tokens = 0
-            output_tokens = 0
-            if hasattr(response, "usage") and response.usage:
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                logger.info(
-                    f"Research agent {agent.id}: {input_tokens}+{output_tokens} tokens"
-                )
 
-            # Parse the response
-            return self._parse_response(agent, response, input_tokens, output_tokens)
+class _ResultCache:
+    """On-disk cache of agent results keyed by prompt digest.
 
-        except Exception as e:
-            # Return error result
-            return AgentResult(
-                agent_id=agent.id,
-                findings=[f"Error during research: {e!s}"],
-                sources=[],
-                recommendations=[],
-                raw_response=None,
-            )
+    Each result is stored as one JSON file; entries older than the TTL are
+    treated as missing.
+    """
 
-    def _build_research_prompt(
-        self,
-        agent: AgentDefinition,
-        project_context: str,
-    ) -> str:
-        """Build the research prompt for an agent.
+    def __init__(self, directory: Path, ttl_seconds: int) -> None:
+        """Initialize the cache.
 
-        Uses specialized prompts for documentation framework agent vs domain agents.
+        Args:
+            directory: Directory holding cached results.
+            ttl_seconds: Seconds a cached result stays valid.
         """
-        # Special handling for documentation frameworks agent
-        if agent.id == "agent_000_frameworks":
-            return self._build_frameworks_research_prompt(agent, project_context)
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> AgentResult | None:
+        """Return the cached result for a key, if present and fresh."""
+        path = self.directory / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return AGENT_RESULT_ADAPTER.validate_json(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, result: AgentResult) -> None:
+        """Store a result under a key."""
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Only the frameworks agent's raw text is read back (by the generator)
+            exclude = None if result.agent_id == _FRAMEWORKS_AGENT_ID else {"raw_response"}
+            tmp_path.write_bytes(AGENT_RESULT_ADAPTER.dump_json(result, exclude=exclude))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache research result: {e}")
+
+
+@cache
+def _get_rate_limiter(max_rate: int) -> _RateLimiter:
+    """Get the process-wide limiter for a requests-per-minute budget.
+
+    Rate limits apply per API key, so engines share one bucket.
+    """
+    return _RateLimiter(max_rate)
 
-        # Standard domain research prompt
-        questions = "\n".join(f"- {q}" for q in agent.research_questions)
-        queries = "\n".join(f"- {q}" for q in agent.search_queries)
 
-        return f"""You are a {agent.role} conducting research for a project.
+@lru_cache(maxsize=256)
+def _render_research_prompt(
+    role: str,
+    domains: tuple[str, ...],
+    research_questions: tuple[str, ...],
+    search_queries: tuple[str, ...],
+    project_context: str,
+) -> str:
+    """Render the standard domain research prompt.
+
+    Cached so re-runs over the same context produce byte-identical prompts
+    without rebuilding them.
+    """
+    questions = "\n".join(f"- {q}" for q in research_questions)
+    queries = "\n".join(f"- {q}" for q in search_queries)
+
+    return f"""You are a {role} conducting research for a project.
 
 ## Project Context
 {project_context}
 
 ## Your Research Focus
-{agent.role} - Domains: {', '.join(agent.domains)}
+{role} - Domains: {', '.join(domains)}
 
 ## Research Questions to Answer
 {questions}
@@ -179,35 +239,15 @@ Provide your findings in this structure:
 - RECOMMENDATIONS: Actionable recommendations for the project
 """
 
-    def _build_frameworks_research_prompt(
-        self,
-        agent: AgentDefinition,
-        project_context: str,
-    ) -> str:
-        """Build specialized research prompt for documentation frameworks agent.
-
-        This agent provides professional scaffolding for Llama 3.3 70B, which lacks
-        web access. Claude gathers frameworks, templates, and examples that Llama
-        will use to generate senior-level documentation.
-        """
-        questions = "\n".join(f"- {q}" for q in agent.research_questions)
-        queries = "\n".join(f"- {q}" for q in agent.search_queries)
 
-        return f"""You are a {agent.role} conducting research to provide professional documentation frameworks.
+# Static instructions for the frameworks agent, sent first and marked for
+# provider-side prompt caching; only the dynamic suffix varies per project
+_FRAMEWORKS_STATIC_PROMPT = """You are conducting research to provide professional documentation frameworks.
 
 ## Mission
 Your research will be used by a local AI model (Llama 3.3 70B) that DOES NOT have web access.
 You must gather comprehensive professional scaffolding so it can generate senior-level documentation.
 
-## Project Context
-{project_context}
-
-## Research Questions to Answer
-{questions}
-
-## Suggested Search Queries
-{queries}
-
 ## Critical Requirements
 
 Your findings must include CONCRETE, SPECIFIC information in these categories:
@@ -281,6 +321,278 @@ Provide findings in this EXACT structure:
 5. Focus on nonprofit, tribal, and public sector contexts
 """
 
+
+@lru_cache(maxsize=256)
+def _render_frameworks_prompt(
+    role: str,
+    research_questions: tuple[str, ...],
+    search_queries: tuple[str, ...],
+    project_context: str,
+) -> str:
+    """Render the project-specific suffix of the frameworks research prompt."""
+    questions = "\n".join(f"- {q}" for q in research_questions)
+    queries = "\n".join(f"- {q}" for q in search_queries)
+
+    return f"""## Your Role
+You are a {role}.
+
+## Project Context
+{project_context}
+
+## Research Questions to Answer
+{questions}
+
+## Suggested Search Queries
+{queries}
+"""
+
+
+class ResearchEngine:
+    """Engine for executing research agents via Claude API.
+
+    This is Phase 1 - requires API calls (after privacy approval).
+
+    Provider: Claude API (fixed for now)
+    Reason: Web search capability required
+    """
+
+    # Anthropic clients shared by engines using the same API key; their
+    # connection pool is also shared with generation
+    _shared_clients: dict[str, Any] = {}
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        config: ResearchConfig | None = None,
+    ) -> None:
+        """Initialize the research engine.
+
+        Args:
+            settings: Application settings (for API key).
+            config: Research-specific configuration.
+        """
+        self.settings = settings or get_settings()
+        # Use settings value if no custom config provided
+        if config is None:
+            config = ResearchConfig(
+                max_concurrent_agents=self.settings.max_concurrent_research_agents,
+                timeout_seconds=self.settings.research_timeout,
+            )
+        self.config = config
+        self._limiter = (
+            _get_rate_limiter(self.settings.claude_rpm) if self.settings.claude_rpm else None
+        )
+
+        self._cache = (
+            _ResultCache(
+                self.settings.output_dir / ".research_cache",
+                self.settings.research_cache_ttl,
+            )
+            if self.settings.research_cache_ttl
+            else None
+        )
+
+        # Static arguments shared by every research call
+        self._api_kwargs: dict[str, Any] = {
+            "model": self.settings.claude_model,
+            "max_tokens": self.settings.max_generation_tokens,
+        }
+        if self.config.enable_web_search and self.settings.enable_web_search:
+            self._api_kwargs["tools"] = [{"type": "web_search_20250305"}]
+
+    def _ensure_client(self) -> Any:
+        """Lazily initialize the shared Anthropic async client for this engine's key.
+
+        Clients are cached on the class per API key, so engines with the same
+        credentials share one while an engine built with other settings gets
+        its own. All of them use the process-wide HTTP connection pool.
+        """
+        api_key = self.settings.anthropic_api_key.get_secret_value()
+        client = ResearchEngine._shared_clients.get(api_key)
+        if client is None:
+            try:
+                import anthropic
+            except ImportError:
+                raise RuntimeError("anthropic package not installed")
+
+            client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                max_retries=_MAX_RETRIES,
+                http_client=get_anthropic_http_client(),
+            )
+            ResearchEngine._shared_clients[api_key] = client
+        return client
+
+    @classmethod
+    async def close_shared_client(cls) -> None:
+        """Close the shared Anthropic clients."""
+        clients = list(cls._shared_clients.values())
+        cls._shared_clients.clear()
+        for client in clients:
+            await client.close()
+
+    async def execute_agent(
+        self,
+        agent: AgentDefinition,
+        project_context: str,
+    ) -> AgentResult:
+        """Execute a single research agent.
+
+        Args:
+            agent: The agent definition to execute.
+            project_context: Sanitized project context for research.
+
+        Returns:
+            AgentResult with research findings.
+        """
+        # Build the research prompt
+        content = self._build_message_content(agent, project_context)
+
+        # Identical requests within the cache TTL reuse the earlier result
+        cache_key: str | None = None
+        if self._cache is not None:
+            cache_key = self._cache_key(content)
+            if (cached := self._cache.get(cache_key)) is not None:
+                logger.info(f"Research agent {agent.id}: using cached result")
+                # No API call was made, so nothing is billed for this run
+                return cached.model_copy(update={"input_tokens": 0, "output_tokens": 0})
+
+        client = self._ensure_client()
+
+        # Execute the API call
+        try:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            # Stream the response and parse sections as lines complete
+            parser = _SectionParser()
+            async with asyncio.timeout(self.config.timeout_seconds):
+                async with client.messages.stream(
+                    **self._api_kwargs,
+                    messages=[{"role": "user", "content": content}],
+                ) as stream:
+                    async for text in stream.text_stream:
+                        parser.feed(text)
+                    response = await stream.get_final_message()
+
+            # Capture token usage for cost tracking
+            input_tokens = 0
+            output_tokens = 0
+            if hasattr(response, "usage") and response.usage:
+                input_tokens = response.usage.input_tokens
+                output_tokens = response.usage.output_tokens
+                logger.info(
+                    f"Research agent {agent.id}: {input_tokens}+{output_tokens} tokens"
+                )
+
+            result = self._build_result(agent, parser, input_tokens, output_tokens)
+            if self._cache is not None and cache_key is not None:
+                self._cache.set(cache_key, result)
+            return result
+
+        except TimeoutError:
+            logger.warning(
+                f"Research agent {agent.id} timed out after {self.config.timeout_seconds}s"
+            )
+            return AgentResult(
+                agent_id=agent.id,
+                findings=(
+                    f"Error during research: timed out after {self.config.timeout_seconds}s",
+                ),
+                sources=(),
+                recommendations=(),
+                raw_response=None,
+            )
+
+        except Exception as e:
+            # Return error result
+            return AgentResult(
+                agent_id=agent.id,
+                findings=(f"Error during research: {e!s}",),
+                sources=(),
+                recommendations=(),
+                raw_response=None,
+            )
+
+    def _cache_key(self, content: str | list[dict[str, Any]]) -> str:
+        """Content address of a research request.
+
+        Covers the rendered message content and every API argument, so any
+        change to the prompt templates, model or limits misses the cache.
+        """
+        payload = json.dumps({"content": content, **self._api_kwargs}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _build_research_prompt(
+        self,
+        agent: AgentDefinition,
+        project_context: str,
+    ) -> str:
+        """Build the research prompt for an agent.
+
+        Uses specialized prompts for documentation framework agent vs domain agents.
+        """
+        # Special handling for documentation frameworks agent
+        if agent.id == _FRAMEWORKS_AGENT_ID:
+            return self._build_frameworks_research_prompt(agent, project_context)
+
+        return _render_research_prompt(
+            agent.role,
+            agent.domains,
+            agent.research_questions,
+            agent.search_queries,
+            project_context,
+        )
+
+    def _build_frameworks_research_prompt(
+        self,
+        agent: AgentDefinition,
+        project_context: str,
+    ) -> str:
+        """Build specialized research prompt for documentation frameworks agent.
+
+        This agent provides professional scaffolding for Llama 3.3 70B, which lacks
+        web access. Claude gathers frameworks, templates, and examples that Llama
+        will use to generate senior-level documentation.
+        """
+        context = self._build_frameworks_context(agent, project_context)
+        return f"{_FRAMEWORKS_STATIC_PROMPT}\n{context}"
+
+    def _build_frameworks_context(
+        self,
+        agent: AgentDefinition,
+        project_context: str,
+    ) -> str:
+        """Build the project-specific part of the frameworks prompt."""
+        return _render_frameworks_prompt(
+            agent.role,
+            agent.research_questions,
+            agent.search_queries,
+            project_context,
+        )
+
+    def _build_message_content(
+        self,
+        agent: AgentDefinition,
+        project_context: str,
+    ) -> str | list[dict[str, Any]]:
+        """Build the user message content for an agent's API call.
+
+        The frameworks agent sends its static instructions as a separate
+        cacheable block so repeat calls reuse the provider's prompt cache.
+        """
+        if agent.id != _FRAMEWORKS_AGENT_ID:
+            return self._build_research_prompt(agent, project_context)
+
+        return [
+            {
+                "type": "text",
+                "text": _FRAMEWORKS_STATIC_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": self._build_frameworks_context(agent, project_context)},
+        ]
+
     def _parse_response(
         self,
         agent: AgentDefinition,
@@ -289,44 +601,28 @@ Provide findings in this EXACT structure:
         output_tokens: int = 0,
     ) -> AgentResult:
         """Parse Claude API response into AgentResult."""
-        # Extract text content
-        raw_text = ""
+        parser = _SectionParser()
         for block in response.content:
             if hasattr(block, "text"):
-                raw_text += block.text
-
-        # Simple parsing - look for sections
-        findings: list[str] = []
-        sources: list[str] = []
-        recommendations: list[str] = []
-
-        current_section = None
-        for line in raw_text.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-
-            upper_line = line.upper()
-            if "KEY FINDINGS" in upper_line or "FINDINGS:" in upper_line:
-                current_section = "findings"
-            elif "SOURCES:" in upper_line or "REFERENCES:" in upper_line:
-                current_section = "sources"
-            elif "RECOMMENDATIONS:" in upper_line:
-                current_section = "recommendations"
-            elif line.startswith(("-", "•", "*")) and current_section:
-                content = line.lstrip("-•* ").strip()
-                if current_section == "findings":
-                    findings.append(content)
-                elif current_section == "sources":
-                    sources.append(content)
-                elif current_section == "recommendations":
-                    recommendations.append(content)
-
-        return AgentResult(
+                parser.feed(block.text)
+
+        return self._build_result(agent, parser, input_tokens, output_tokens)
+
+    def _build_result(
+        self,
+        agent: AgentDefinition,
+        parser: _SectionParser,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> AgentResult:
+        """Build an AgentResult from a fully fed section parser."""
+        raw_text = parser.close()
+
+        return AgentResult.from_trusted(
             agent_id=agent.id,
-            findings=findings or ["No specific findings extracted"],
-            sources=sources,
-            recommendations=recommendations,
+            findings=tuple(parser.findings) or ("No specific findings extracted",),
+            sources=tuple(parser.sources),
+            recommendations=tuple(parser.recommendations),
             raw_response=raw_text,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
@@ -348,12 +644,20 @@ Provide findings in this EXACT structure:
         """
         semaphore = asyncio.Semaphore(self.config.max_concurrent_agents)
 
-        async def bounded_execute(agent: AgentDefinition) -> AgentResult:
-            async with semaphore:
-                return await self.execute_agent(agent, project_context)
-
-        tasks = [bounded_execute(agent) for agent in agents]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Acquire a slot before creating each task so at most
+        # max_concurrent_agents coroutines are alive at once
+        tasks: list[asyncio.Task[AgentResult]] = []
+        try:
+            for agent in agents:
+                await semaphore.acquire()
+                task = asyncio.create_task(self.execute_agent(agent, project_context))
+                task.add_done_callback(lambda _: semaphore.release())
+                tasks.append(task)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Convert exceptions to error results
         final_results: list[AgentResult] = []
@@ -362,9 +666,9 @@ Provide findings in this EXACT structure:
                 final_results.append(
                     AgentResult(
                         agent_id=agents[i].id,
-                        findings=[f"Agent execution failed: {result!s}"],
-                        sources=[],
-                        recommendations=[],
+                        findings=(f"Agent execution failed: {result!s}",),
+                        sources=(),
+                        recommendations=(),
                     )
                 )
             else:
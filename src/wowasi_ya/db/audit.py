@@ -6,7 +6,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class AuditAction(str, Enum):
@@ -35,6 +35,10 @@ class AuditLog(BaseModel):
     error_message: str | None = None
 
 
+# Serializes entries straight to UTF-8 JSON bytes
+_AUDIT_LOG_ADAPTER = TypeAdapter(AuditLog)
+
+
 class AuditLogger:
     """Logger for audit trail.
 
@@ -89,8 +93,8 @@ class AuditLogger:
         )
 
         # Append to log file (JSONL format)
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(entry.model_dump_json() + "\n")
+        with self.log_path.open("ab") as f:
+            f.write(_AUDIT_LOG_ADAPTER.dump_json(entry) + b"\n")
 
         return entry
 
@@ -1,17 +1,40 @@
 """Persistent storage for project states."""
 
 import json
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
 
+from pydantic import TypeAdapter
+
 from wowasi_ya.models.project import ProjectState
 
+# Serializes states straight to UTF-8 JSON bytes
+_STATE_ADAPTER = TypeAdapter(ProjectState)
+
+# Marks a record that deletes the project with the given ID
+_TOMBSTONE_KEY = "deleted_id"
+
+# Leading ID of a state or tombstone record, captured as a JSON string body
+_RECORD_ID_PATTERN = re.compile(
+    rf'\{{"(?P<key>id|{_TOMBSTONE_KEY})":\s*"(?P<id>(?:[^"\\]|\\.)*)"'.encode()
+)
+
+# Rewrite the log once it holds this many times more records than live states
+_COMPACTION_RATIO = 2
+
+# Never compact logs smaller than this many records
+_MIN_COMPACTION_RECORDS = 64
+
 
 class ProjectStateStore:
     """Persistent storage for project states.
 
-    Stores project states in a JSONL file (one JSON object per line).
+    Stores project states in an append-only JSONL file (one JSON object per
+    line). Each update appends a record and the latest record for an ID wins,
+    so writes cost O(1); the file is compacted once stale records pile up.
     Loads all states into memory on startup for fast access.
     """
 
@@ -23,8 +46,10 @@ class ProjectStateStore:
         """
         self.storage_path = storage_path or Path("./project_states.jsonl")
         self._states: Dict[str, ProjectState] = {}
+        self._record_count = 0
         self._ensure_storage_file()
         self._load_states()
+        self._maybe_compact()
 
     def _ensure_storage_file(self) -> None:
         """Ensure the storage file exists."""
@@ -33,29 +58,87 @@ class ProjectStateStore:
             self.storage_path.touch()
 
     def _load_states(self) -> None:
-        """Load all project states from disk into memory."""
+        """Replay the state log from disk into memory.
+
+        Records are grouped by their leading ID first and validated newest
+        first, so normally only the latest record for each project is parsed;
+        a torn latest record falls back to the one before it.
+        """
         if not self.storage_path.exists():
             return
 
-        with self.storage_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    state = ProjectState.model_validate_json(line)
-                    self._states[state.id] = state
-                except Exception as e:
-                    # Log and skip malformed entries
-                    print(f"Warning: Failed to load project state: {e}")
-                    continue
+        history: dict[str, list[bytes]] = {}
+        for line in self.storage_path.read_bytes().splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            self._record_count += 1
+            match = _RECORD_ID_PATTERN.match(line)
+            if match is None:
+                state = self._load_record(line)
+                if state is not None:
+                    history.setdefault(state.id, []).append(line)
+                continue
+
+            project_id = json.loads(b'"' + match["id"] + b'"')
+            if match["key"] == b"id":
+                history.setdefault(project_id, []).append(line)
+            else:
+                history.pop(project_id, None)
+                self._states.pop(project_id, None)
+
+        for lines in history.values():
+            for line in reversed(lines):
+                if self._load_record(line) is not None:
+                    break
+
+    def _load_record(self, line: bytes) -> ProjectState | None:
+        """Validate one state record into memory."""
+        try:
+            state = ProjectState.model_validate_json(line)
+        except Exception as e:
+            # Log and skip malformed entries
+            print(f"Warning: Failed to load project state: {e}")
+            return None
+        self._states[state.id] = state
+        return state
+
+    def _append(self, record: bytes) -> None:
+        """Append one record to the state log."""
+        with self.storage_path.open("a+b") as f:
+            prefix = b""
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Last record was torn by a crash; start on a fresh line
+                    prefix = b"\n"
+            f.write(prefix + record + b"\n")
+        self._record_count += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log when stale records outnumber live states."""
+        if self._record_count < _MIN_COMPACTION_RECORDS:
+            return
+        if self._record_count > _COMPACTION_RATIO * len(self._states):
+            self._save_all()
 
     def _save_all(self) -> None:
-        """Write all states to disk."""
-        with self.storage_path.open("w", encoding="utf-8") as f:
-            for state in self._states.values():
-                f.write(state.model_dump_json() + "\n")
+        """Write all states to disk, dropping superseded records.
+
+        Writes to a temporary file and swaps it in with os.replace, so a crash
+        mid-write never leaves a truncated state file.
+        """
+        tmp_path = self.storage_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(
+                b"".join(_STATE_ADAPTER.dump_json(state) + b"\n" for state in self._states.values())
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.storage_path)
+        self._record_count = len(self._states)
 
     def get(self, project_id: str) -> ProjectState | None:
         """Get a project state by ID.
@@ -76,7 +159,7 @@ class ProjectStateStore:
         """
         state.updated_at = datetime.utcnow()
         self._states[state.id] = state
-        self._save_all()
+        self._append(_STATE_ADAPTER.dump_json(state))
 
     def list_all(self) -> list[ProjectState]:
         """List all project states.
@@ -101,7 +184,7 @@ class ProjectStateStore:
         """
         if project_id in self._states:
             del self._states[project_id]
-            self._save_all()
+            self._append(json.dumps({_TOMBSTONE_KEY: project_id}).encode("utf-8"))
             return True
         return False
 
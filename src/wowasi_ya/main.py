@@ -1,17 +1,60 @@
 """FastAPI application entry point."""
 
+import hashlib
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Scope
 
 from wowasi_ya import __version__
 from wowasi_ya.api import router
 from wowasi_ya.config import get_settings
+from wowasi_ya.core.llm_client import close_anthropic_http_client
+from wowasi_ya.core.research import ResearchEngine
+
+# Built React portal served alongside the API
+_PORTAL_DIR = Path(__file__).parent.parent.parent / "portal" / "dist"
+
+
+class PortalFiles(StaticFiles):
+    """Static portal files with an in-memory index.html fallback.
+
+    Existing files are served by StaticFiles; any other path gets the cached
+    index.html so React Router can handle client-side routing.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the portal file server.
+
+        Args:
+            directory: Directory containing the built portal.
+        """
+        super().__init__(directory=str(directory), html=True)
+        self.index_html = (directory / "index.html").read_bytes()
+        self.index_etag = f'"{hashlib.sha1(self.index_html).hexdigest()}"'
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a portal file, falling back to index.html."""
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as exc:
+            if exc.status_code != 404:
+                raise
+        return self.index_response(Request(scope))
+
+    def index_response(self, request: Request) -> Response:
+        """Serve the cached index.html, honoring If-None-Match."""
+        headers = {"ETag": self.index_etag}
+        if request.headers.get("if-none-match") == self.index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(self.index_html, media_type="text/html", headers=headers)
 
 
 @asynccontextmanager
@@ -28,10 +71,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     print("Shutting down Wowasi_ya")
+    await ResearchEngine.close_shared_client()
+    await close_anthropic_http_client()
+
 
+def create_app(portal_dir: Path = _PORTAL_DIR) -> FastAPI:
+    """Create and configure the FastAPI application.
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
+    Args:
+        portal_dir: Directory containing the built portal, served when present.
+    """
     settings = get_settings()
 
     app = FastAPI(
@@ -66,39 +115,10 @@ def create_app() -> FastAPI:
     # Include API routes
     app.include_router(router, prefix="/api/v1", tags=["projects"])
 
-    # Serve portal from portal/dist (built React app)
-    portal_dir = Path(__file__).parent.parent.parent / "portal" / "dist"
+    # Serve portal from portal/dist (built React app); mounted after the API
+    # routes so /api/v1 takes precedence
     if portal_dir.exists():
-        # Mount assets folder for JS/CSS bundles
-        assets_dir = portal_dir / "assets"
-        if assets_dir.exists():
-            app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-
-        # Serve static files from portal dist (images, etc.)
-        @app.get("/vite.svg")
-        async def serve_vite_svg() -> FileResponse:
-            return FileResponse(str(portal_dir / "vite.svg"))
-
-        @app.get("/iyeska-logo.png")
-        async def serve_logo() -> FileResponse:
-            return FileResponse(str(portal_dir / "iyeska-logo.png"))
-
-        # SPA catch-all: serve index.html for all non-API routes
-        # This enables React Router to handle client-side routing
-        @app.get("/{path:path}")
-        async def serve_spa(path: str) -> FileResponse:
-            """Serve the portal SPA for all non-API routes."""
-            # Check if it's a file that exists in portal dist
-            file_path = portal_dir / path
-            if file_path.exists() and file_path.is_file():
-                return FileResponse(str(file_path))
-            # Otherwise serve index.html for SPA routing
-            return FileResponse(str(portal_dir / "index.html"))
-
-        @app.get("/")
-        async def read_root() -> FileResponse:
-            """Serve the portal dashboard."""
-            return FileResponse(str(portal_dir / "index.html"))
+        app.mount("/", PortalFiles(portal_dir), name="portal")
 
     return app
 
@@ -1,17 +1,44 @@
 """Pydantic models for Wowasi_ya."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from wowasi_ya.models.agent import AgentDefinition, AgentResult, DomainMatch
 from wowasi_ya.models.document import Document, DocumentBatch, GeneratedProject
-from wowasi_ya.models.next_steps import (
-    ActionType,
-    NextStepTemplate,
-    OutlineMapping,
-    ProjectNextStep,
-    ProjectProgress,
-    StepStatus,
-)
 from wowasi_ya.models.project import ProjectInput, ProjectStatus
 
+if TYPE_CHECKING:
+    from wowasi_ya.models.next_steps import (
+        ActionType,
+        NextStepTemplate,
+        OutlineMapping,
+        ProjectNextStep,
+        ProjectProgress,
+        StepStatus,
+    )
+
+# Re-exports loaded on first access (PEP 562) so importing the package does
+# not build the next-steps schemas up front
+_LAZY_EXPORTS = {
+    "ActionType": "next_steps",
+    "NextStepTemplate": "next_steps",
+    "OutlineMapping": "next_steps",
+    "ProjectNextStep": "next_steps",
+    "ProjectProgress": "next_steps",
+    "StepStatus": "next_steps",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily re-exported models on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ActionType",
     "AgentDefinition",
@@ -1,11 +1,18 @@
 """Agent definition and result models."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Agent execution priority, 1 being the highest
+AgentPriority = Literal[1, 2, 3, 4, 5]
 
 
 class DomainMatch(BaseModel):
     """A matched domain from the project description."""
 
+    model_config = ConfigDict(defer_build=True, extra="forbid", frozen=True)
+
     domain: str = Field(..., description="Domain name (e.g., 'healthcare', 'education')")
     keywords: list[str] = Field(default_factory=list, description="Matched keywords")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Match confidence score")
@@ -18,35 +25,72 @@ class DomainMatch(BaseModel):
 class AgentDefinition(BaseModel):
     """Definition for a research agent."""
 
+    model_config = ConfigDict(defer_build=True, extra="forbid", frozen=True)
+
     id: str = Field(..., description="Unique agent identifier")
     name: str = Field(..., description="Human-readable agent name")
     role: str = Field(..., description="Agent's research role/focus")
-    domains: list[str] = Field(default_factory=list, description="Relevant domains")
-    research_questions: list[str] = Field(
-        default_factory=list,
+    domains: tuple[str, ...] = Field(default=(), description="Relevant domains")
+    research_questions: tuple[str, ...] = Field(
+        default=(),
         description="Questions this agent should research",
     )
-    search_queries: list[str] = Field(
-        default_factory=list,
+    search_queries: tuple[str, ...] = Field(
+        default=(),
         description="Suggested web search queries",
     )
-    priority: int = Field(default=1, ge=1, le=5, description="Agent priority (1=highest)")
+    priority: AgentPriority = Field(default=1, description="Agent priority (1=highest)")
 
 
 class AgentResult(BaseModel):
     """Result from an agent's research."""
 
-    agent_id: str = Field(..., description="ID of the agent that produced this result")
-    findings: list[str] = Field(default_factory=list, description="Key findings")
-    sources: list[str] = Field(default_factory=list, description="Source URLs or references")
-    recommendations: list[str] = Field(
-        default_factory=list,
-        description="Recommendations based on research",
-    )
-    raw_response: str | None = Field(
-        default=None,
-        description="Raw response from Claude API",
-    )
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
+    agent_id: str
+    findings: tuple[str, ...] = ()
+    sources: tuple[str, ...] = ()  # Source URLs or references
+    recommendations: tuple[str, ...] = ()
+    raw_response: str | None = None  # Raw response from Claude API
     # Token usage for cost tracking
-    input_tokens: int = Field(default=0, description="Input tokens used")
-    output_tokens: int = Field(default=0, description="Output tokens used")
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @classmethod
+    def from_trusted(
+        cls,
+        agent_id: str,
+        findings: tuple[str, ...],
+        sources: tuple[str, ...],
+        recommendations: tuple[str, ...],
+        raw_response: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> "AgentResult":
+        """Build a result from values produced by our own parser, skipping validation.
+
+        Args:
+            agent_id: ID of the agent that produced the result.
+            findings: Parsed findings.
+            sources: Parsed sources.
+            recommendations: Parsed recommendations.
+            raw_response: Raw response text.
+            input_tokens: Input tokens used.
+            output_tokens: Output tokens used.
+
+        Returns:
+            Unvalidated AgentResult; use the normal constructor for external data.
+        """
+        return cls.model_construct(
+            agent_id=agent_id,
+            findings=findings,
+            sources=sources,
+            recommendations=recommendations,
+            raw_response=raw_response,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+
+
+# Shared adapter for (de)serializing agent results as JSON bytes
+AGENT_RESULT_ADAPTER = TypeAdapter(AgentResult)
@@ -1,12 +1,19 @@
 """Document generation models."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 
-class DocumentType(str, Enum):
+def _count_words(content: str) -> int:
+    """Number of whitespace-separated words in markdown content."""
+    return len(content.split())
+
+
+class DocumentType(StrEnum):
     """Types of documents in the 15-document template."""
 
     README = "README"
@@ -29,87 +36,163 @@ class DocumentType(str, Enum):
 class Document(BaseModel):
     """A generated document."""
 
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
     type: DocumentType
-    title: str = Field(..., description="Document title")
-    content: str = Field(..., description="Markdown content")
-    folder: str = Field(..., description="Target folder (e.g., '00-Overview')")
-    filename: str = Field(..., description="Output filename")
+    title: str
+    content: str  # Markdown
+    folder: str  # Target folder (e.g., '00-Overview')
+    filename: str
     generated_at: datetime = Field(default_factory=datetime.utcnow)
-    word_count: int = Field(default=0)
+    word_count: int = Field(default=0, ge=0)  # Derived from content unless given
     quality_score: float | None = Field(default=None, ge=0.0, le=1.0)
 
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_word_count(cls, data: Any) -> Any:
+        """Count the content's words when no word_count is supplied."""
+        if isinstance(data, dict) and "word_count" not in data:
+            content = data.get("content")
+            if isinstance(content, str):
+                return {**data, "word_count": _count_words(content)}
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, recounting words when the content is replaced."""
+        super().__setattr__(name, value)
+        if name == "content":
+            super().__setattr__("word_count", _count_words(self.content))
+
 
-class DocumentBatch(BaseModel):
-    """A batch of documents to generate together."""
+@dataclass(frozen=True, slots=True)
+class DocumentBatch:
+    """A batch of documents to generate together.
 
-    batch_number: int = Field(..., ge=1, le=5)
-    document_types: list[DocumentType]
-    depends_on: list[int] = Field(
-        default_factory=list,
-        description="Batch numbers this batch depends on",
-    )
+    Static configuration, so a frozen dataclass rather than a validated model.
+    """
+
+    batch_number: Literal[1, 2, 3, 4, 5]
+    document_types: tuple[DocumentType, ...]
+    depends_on: tuple[int, ...] = ()  # Batch numbers this batch depends on
 
 
 class GeneratedProject(BaseModel):
     """Complete generated project with all documents."""
 
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
     project_name: str
     project_area: str = Field(default="04_Iyeska", description="Project area/category")
-    documents: list[Document] = Field(default_factory=list)
+    documents: tuple[Document, ...] = ()
     total_word_count: int = Field(default=0)
     generation_time_seconds: float = Field(default=0.0)
-    output_paths: list[str] = Field(default_factory=list)
+    output_paths: tuple[str, ...] = ()
     created_at: datetime = Field(default_factory=datetime.utcnow)
     # Token usage for cost tracking
     total_input_tokens: int = Field(default=0, description="Total input tokens used")
     total_output_tokens: int = Field(default=0, description="Total output tokens used")
 
 
+# Serializes and validates whole document lists in one pydantic-core call
+DOCUMENT_LIST_ADAPTER = TypeAdapter(list[Document], config=ConfigDict(defer_build=True))
+
+
 # Document batch definitions (from Process-Workflow.md)
-DOCUMENT_BATCHES = [
+DOCUMENT_BATCHES = (
     DocumentBatch(
         batch_number=1,
-        document_types=[
+        document_types=(
             DocumentType.README,
             DocumentType.PROJECT_BRIEF,
             DocumentType.GLOSSARY,
-        ],
-        depends_on=[],
+        ),
+        depends_on=(),
     ),
     DocumentBatch(
         batch_number=2,
-        document_types=[
+        document_types=(
             DocumentType.CONTEXT_BACKGROUND,
             DocumentType.STAKEHOLDER_NOTES,
-        ],
-        depends_on=[1],
+        ),
+        depends_on=(1,),
     ),
     DocumentBatch(
         batch_number=3,
-        document_types=[
+        document_types=(
             DocumentType.GOALS_SUCCESS,
             DocumentType.SCOPE_BOUNDARIES,
             DocumentType.INITIAL_BUDGET,
             DocumentType.TIMELINE_MILESTONES,
             DocumentType.RISKS_ASSUMPTIONS,
-        ],
-        depends_on=[1, 2],
+        ),
+        depends_on=(1, 2),
     ),
     DocumentBatch(
         batch_number=4,
-        document_types=[
+        document_types=(
             DocumentType.PROCESS_WORKFLOW,
             DocumentType.SOPS,
             DocumentType.TASK_BACKLOG,
-        ],
-        depends_on=[3],
+        ),
+        depends_on=(3,),
     ),
     DocumentBatch(
         batch_number=5,
-        document_types=[
+        document_types=(
             DocumentType.MEETING_NOTES,
             DocumentType.STATUS_UPDATES,
-        ],
-        depends_on=[],
+        ),
+        depends_on=(),
     ),
-]
+)
+
+
+def _batch_schedule(
+    batches: tuple[DocumentBatch, ...],
+) -> tuple[int, ...]:
+    """Resolve batch dependencies once into an execution order.
+
+    Dependencies are encoded as bitmasks (bit n-1 for batch n), so a batch is
+    ready when ``deps & done_mask == deps``. Among ready batches the earliest
+    declared runs first, keeping the declared order when it is already valid.
+
+    Args:
+        batches: Batch definitions, declared in batch-number order.
+
+    Returns:
+        Batch numbers in execution order.
+
+    Raises:
+        ValueError: If a dependency is unknown or the dependencies form a cycle.
+    """
+    deps_masks: list[int] = []
+    for batch in batches:
+        mask = 0
+        for dep in batch.depends_on:
+            if not 1 <= dep <= len(batches):
+                raise ValueError(f"Batch {batch.batch_number} depends on unknown batch {dep}")
+            mask |= 1 << (dep - 1)
+        deps_masks.append(mask)
+
+    order: list[int] = []
+    done_mask = 0
+    while len(order) < len(batches):
+        for batch, deps in zip(batches, deps_masks, strict=True):
+            bit = 1 << (batch.batch_number - 1)
+            if not done_mask & bit and deps & done_mask == deps:
+                order.append(batch.batch_number)
+                done_mask |= bit
+                break
+        else:
+            raise ValueError("Document batch dependencies form a cycle")
+
+    return tuple(order)
+
+
+# Batch lookup by number, built once at import
+DOCUMENT_BATCHES_BY_NUMBER: dict[int, DocumentBatch] = {
+    batch.batch_number: batch for batch in DOCUMENT_BATCHES
+}
+
+# Precomputed at import so generation never re-resolves dependencies
+BATCH_ORDER = _batch_schedule(DOCUMENT_BATCHES)
@@ -1,15 +1,19 @@
 """Next Steps models for project action tracking."""
 
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from wowasi_ya.models.document import DocumentType
 
 
-class ActionType(str, Enum):
+class ActionType(StrEnum):
     """Types of actions for next steps."""
 
     GUIDANCE = "guidance"  # Read-only instructions
@@ -17,7 +21,7 @@ class ActionType(str, Enum):
     FORM = "form"  # Input fields (assign owner, set date)
 
 
-class StepStatus(str, Enum):
+class StepStatus(StrEnum):
     """Status of a next step."""
 
     NOT_STARTED = "not_started"
@@ -32,6 +36,8 @@ class NextStepTemplate(BaseModel):
     These are predefined and seeded at startup.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Unique template ID")
     document_type: DocumentType
     step_order: int = Field(..., ge=1, description="Order within document type")
@@ -51,6 +57,8 @@ class ProjectNextStep(BaseModel):
     Created when a project is published to track progress.
     """
 
+    model_config = ConfigDict(defer_build=True, extra="forbid")
+
     id: str = Field(..., description="Unique instance ID")
     project_id: str = Field(..., description="Associated project ID")
     template_id: str = Field(..., description="Reference to NextStepTemplate")
@@ -75,24 +83,61 @@ class ProjectNextStep(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    @classmethod
+    def from_template(
+        cls,
+        project_id: str,
+        template: NextStepTemplate,
+        now: datetime,
+    ) -> "ProjectNextStep":
+        """Build a new step from a predefined template, skipping validation.
 
-class OutlineMapping(BaseModel):
-    """Maps a wowasi project to its Outline collection and documents."""
+        Args:
+            project_id: The project ID.
+            template: Template the step is created from.
+            now: Creation timestamp shared by the batch.
+
+        Returns:
+            Unvalidated ProjectNextStep; use the normal constructor for external data.
+        """
+        return cls.model_construct(
+            id=str(uuid.uuid4()),
+            project_id=project_id,
+            template_id=template.id,
+            document_type=template.document_type,
+            title=template.title,
+            description=template.description,
+            action_type=template.action_type,
+            # Copy so updates to a step's config never touch the template
+            action_config=dict(template.action_config),
+            is_required=template.is_required,
+            status=StepStatus.NOT_STARTED,
+            created_at=now,
+            updated_at=now,
+        )
 
-    id: str = Field(..., description="Unique mapping ID")
-    project_id: str = Field(..., description="Wowasi project ID")
-    outline_collection_id: str = Field(..., description="Outline collection ID")
-    outline_collection_url: str = Field(..., description="Outline collection URL")
-    outline_document_ids: dict[str, str] = Field(
-        default_factory=dict,
-        description="Map of document_type -> outline_document_id",
-    )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+@dataclass(frozen=True, slots=True)
+class OutlineMapping:
+    """Maps a wowasi project to its Outline collection and documents.
+
+    A plain record written and read only by the mapping store, so a frozen
+    dataclass rather than a validated model.
+    """
+
+    id: str  # Unique mapping ID
+    project_id: str  # Wowasi project ID
+    outline_collection_id: str
+    outline_collection_url: str
+    outline_document_ids: dict[str, str] = field(default_factory=dict)  # document_type -> ID
+    created_at: datetime = field(default_factory=datetime.utcnow)
 
 
 class ProjectProgress(BaseModel):
     """Aggregated progress for a project."""
 
+    model_config = ConfigDict(defer_build=True, extra="forbid", frozen=True)
+
     project_id: str
     total_steps: int
     completed_steps: int
@@ -109,7 +154,7 @@ class ProjectProgress(BaseModel):
 
 
 # Predefined next step templates for all 15 document types
-NEXT_STEP_TEMPLATES: list[dict[str, Any]] = [
+_NEXT_STEP_TEMPLATE_DICTS: tuple[dict[str, Any], ...] = (
     # Project Brief
     {
         "id": "brief-1",
@@ -696,4 +741,25 @@ NEXT_STEP_TEMPLATES: list[dict[str, Any]] = [
         },
         "is_required": False,
     },
-]
+)
+
+# Author-controlled data, so the templates are built once without validation
+NEXT_STEP_TEMPLATES: tuple[NextStepTemplate, ...] = tuple(
+    NextStepTemplate.model_construct(**template) for template in _NEXT_STEP_TEMPLATE_DICTS
+)
+
+# Read-only template indexes, built once so lookups never scan the templates
+TEMPLATE_BY_ID: Mapping[str, NextStepTemplate] = MappingProxyType(
+    {template.id: template for template in NEXT_STEP_TEMPLATES}
+)
+TEMPLATES_BY_DOC_TYPE: Mapping[DocumentType, tuple[NextStepTemplate, ...]] = MappingProxyType(
+    {
+        document_type: tuple(
+            sorted(
+                (t for t in NEXT_STEP_TEMPLATES if t.document_type == document_type),
+                key=lambda t: t.step_order,
+            )
+        )
+        for document_type in DocumentType
+    }
+)
@@ -1,13 +1,13 @@
 """Project input and status models."""
 
 from datetime import datetime
-from enum import Enum
-from typing import Any
+from enum import StrEnum
+from typing import Any, Literal, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class ProjectStatus(str, Enum):
+class ProjectStatus(StrEnum):
     """Status of a project generation request."""
 
     PENDING = "pending"
@@ -22,6 +22,20 @@ class ProjectStatus(str, Enum):
     FAILED = "failed"
 
 
+# Area folders projects are filed under in the vault and Google Drive
+ProjectArea = Literal["01_Personal", "02_MBIRI", "03_NativeBio", "04_Iyeska", "05_ProjectH3LP"]
+
+# Destinations supported by OutputManager.write
+OutputFormat = Literal["filesystem", "obsidian", "git", "gdrive", "outline"]
+
+# Stored input values outside the literal sets, replaced on load by these
+# defaults (records written while area and output_format were free strings)
+_LEGACY_INPUT_FALLBACKS: dict[str, tuple[frozenset[str], str]] = {
+    "area": (frozenset(get_args(ProjectArea)), "04_Iyeska"),
+    "output_format": (frozenset(get_args(OutputFormat)), "filesystem"),
+}
+
+
 class ProjectInput(BaseModel):
     """Input model for creating a new project."""
 
@@ -32,24 +46,20 @@ class ProjectInput(BaseModel):
         max_length=10000,
         description="Detailed project description",
     )
-    area: str = Field(
-        default="04_Iyeska",
-        description="Project area/category (e.g., 01_Personal, 02_MBIRI, 03_NativeBio, 04_Iyeska, 05_ProjectH3LP)",
-    )
+    area: ProjectArea = Field(default="04_Iyeska", description="Project area/category")
     additional_context: str | None = Field(
         default=None,
         max_length=5000,
         description="Optional additional context or requirements",
     )
-    output_format: str = Field(
-        default="filesystem",
-        description="Output format: filesystem, obsidian, or git",
-    )
+    output_format: OutputFormat = Field(default="filesystem", description="Output format")
 
 
 class ProjectState(BaseModel):
     """Current state of a project generation."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Unique project ID")
     input: ProjectInput
     status: ProjectStatus = ProjectStatus.PENDING
@@ -66,3 +76,23 @@ class ProjectState(BaseModel):
     generated_documents: list[Any] = Field(default_factory=list)
     quality_issues: list[Any] = Field(default_factory=list)
     output_paths: list[str] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _map_legacy_input(cls, data: Any) -> Any:
+        """Replace stored input values the literal types no longer accept.
+
+        New requests are still rejected for unknown values; this only keeps
+        previously persisted projects from failing validation on load.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("input"), dict):
+            return data
+        stored = data["input"]
+        legacy = {
+            field: fallback
+            for field, (allowed, fallback) in _LEGACY_INPUT_FALLBACKS.items()
+            if field in stored and stored[field] not in allowed
+        }
+        if not legacy:
+            return data
+        return {**data, "input": {**stored, **legacy}}
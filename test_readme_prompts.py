@@ -2,11 +2,18 @@
 """Compare two README prompt versions for Oahe Legacy Living project."""
 
 import asyncio
+import hashlib
 import os
+import re
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import anthropic
 
 # Project context extracted from existing documents
-PROJECT_CONTEXT = """
+PROJECT_CONTEXT: Final[str] = """
 PROJECT NAME: Oahe Legacy Living
 
 PROJECT DESCRIPTION:
@@ -135,36 +142,78 @@ PROJECT CONTEXT:
 {context}
 """
 
+# Both prompts are constant, so fill in the context once at import
+_FULL_ORIGINAL: Final[str] = PROMPT_ORIGINAL.format(context=PROJECT_CONTEXT)
+_FULL_MODIFIED: Final[str] = PROMPT_MODIFIED.format(context=PROJECT_CONTEXT)
 
-async def generate_readme(prompt_template: str, prompt_name: str) -> str:
-    """Generate README using the given prompt template."""
-    import anthropic
+# Filler phrases the modified prompt asks the model to avoid
+FILLER_PHRASES = (
+    "it is important",
+    "in order to",
+    "robust",
+    "comprehensive",
+    "leveraging",
+    "this document aims",
+    "furthermore",
+    "moreover",
+)
+
+MODEL = "claude-sonnet-4-20250514"
+OUTPUT_DIR = Path("output/prompt_comparison")
+
+# Bump to invalidate every cached generation
+CACHE_VERSION = "1"
+
+# Em-dash spellings the modified prompt forbids
+EMDASHES = ("—", "--")
 
-    client = anthropic.AsyncAnthropic()
+# One alternation so each README is scanned once for dashes and phrases
+_LEXICAL_PATTERN = re.compile("|".join(map(re.escape, EMDASHES + FILLER_PHRASES)))
 
-    full_prompt = prompt_template.format(context=PROJECT_CONTEXT)
 
+async def generate_readme(
+    client: "anthropic.AsyncAnthropic", prompt: str, prompt_name: str
+) -> str:
+    """Generate README using the given fully formatted prompt."""
     print(f"\n{'='*60}")
     print(f"Generating README with: {prompt_name}")
     print(f"{'='*60}")
 
-    message = await client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        messages=[
-            {"role": "user", "content": full_prompt}
-        ]
-    )
-
-    content = message.content[0].text
-
-    # Save to file
-    output_dir = Path("output/prompt_comparison")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     filename = f"README_{prompt_name}.md"
-    output_path = output_dir / filename
-    output_path.write_text(content)
+    output_path = OUTPUT_DIR / filename
+
+    # Unchanged prompts reuse the previous generation instead of calling the API
+    key = hashlib.sha256(f"{CACHE_VERSION}:{MODEL}:{prompt}".encode()).hexdigest()[:16]
+    cache_path = OUTPUT_DIR / "cache" / f"{prompt_name}_{key}.md"
+    if cache_path.exists():
+        content = cache_path.read_text()
+        output_path.write_text(content)
+        print(f"Reused cached generation: {cache_path}")
+    else:
+        # Stream tokens straight to the file as they arrive; writes are
+        # buffered by the file object, so they do not stall the other generation
+        parts: list[str] = []
+        async with client.messages.stream(
+            model=MODEL,
+            max_tokens=4096,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        ) as stream:
+            with output_path.open("w") as f:
+                async for text in stream.text_stream:
+                    f.write(text)
+                    parts.append(text)
+
+        content = "".join(parts)
+
+        # Write then rename so an interrupted run never leaves a partial cache entry
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, cache_path)
 
     print(f"Saved to: {output_path}")
     print(f"Word count: {len(content.split())}")
@@ -180,42 +229,39 @@ async def main():
     print("Project: Oahe Legacy Living")
     print("="*60)
 
-    # Generate with both prompts
-    original = await generate_readme(PROMPT_ORIGINAL, "original")
-    modified = await generate_readme(PROMPT_MODIFIED, "modified")
+    import anthropic
+
+    # Generate with both prompts concurrently, sharing one connection pool
+    async with anthropic.AsyncAnthropic() as client:
+        original, modified = await asyncio.gather(
+            generate_readme(client, _FULL_ORIGINAL, "original"),
+            generate_readme(client, _FULL_MODIFIED, "modified"),
+        )
 
     # Quick analysis
     print("\n" + "="*60)
     print("QUICK COMPARISON")
     print("="*60)
 
+    orig_counts = Counter(_LEXICAL_PATTERN.findall(original.lower()))
+    mod_counts = Counter(_LEXICAL_PATTERN.findall(modified.lower()))
+
     # Count em-dashes
-    original_emdash = original.count("—") + original.count("--")
-    modified_emdash = modified.count("—") + modified.count("--")
+    original_emdash = sum(orig_counts[dash] for dash in EMDASHES)
+    modified_emdash = sum(mod_counts[dash] for dash in EMDASHES)
     print(f"\nEm-dash count:")
     print(f"  Original: {original_emdash}")
     print(f"  Modified: {modified_emdash}")
 
     # Count filler phrases
-    filler_phrases = [
-        "it is important",
-        "in order to",
-        "robust",
-        "comprehensive",
-        "leveraging",
-        "this document aims",
-        "furthermore",
-        "moreover",
-    ]
-
     print(f"\nFiller phrase occurrences:")
-    for phrase in filler_phrases:
-        orig_count = original.lower().count(phrase)
-        mod_count = modified.lower().count(phrase)
+    for phrase in FILLER_PHRASES:
+        orig_count = orig_counts[phrase]
+        mod_count = mod_counts[phrase]
         if orig_count > 0 or mod_count > 0:
             print(f"  '{phrase}': Original={orig_count}, Modified={mod_count}")
 
-    print(f"\nOutput files saved to: output/prompt_comparison/")
+    print(f"\nOutput files saved to: {OUTPUT_DIR}/")
     print(f"  - README_original.md")
     print(f"  - README_modified.md")
     print("\nReview both files to compare quality.")
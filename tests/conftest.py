@@ -1,14 +1,35 @@
 """Pytest configuration and fixtures."""
 
+import base64
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
 from wowasi_ya.config import Settings
+from wowasi_ya.core import analytics
+from wowasi_ya.core.privacy import PrivacyLayer
 from wowasi_ya.main import app
 from wowasi_ya.models.project import ProjectInput
 
+# Basic auth header for the default admin credentials
+_AUTH_HEADERS = {"Authorization": "Basic " + base64.b64encode(b"admin:changeme").decode()}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session", autouse=True)
+def analytics_db(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Point analytics at a per-session database.
+
+    Each pytest-xdist worker is its own session, so workers never share the
+    SQLite file and API tests can run in parallel with ``-n auto``.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(analytics, "DB_PATH", tmp_path_factory.mktemp("analytics") / "analytics.db")
+        analytics.init_db()
+        yield
+
+
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Create test settings with mock API key."""
     return Settings(
@@ -20,22 +41,25 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> TestClient:
-    """Create a test client for the FastAPI app."""
+    """Create a test client for the FastAPI app, shared by the whole session."""
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers() -> dict[str, str]:
     """Create basic auth headers for test requests."""
-    import base64
+    return _AUTH_HEADERS
 
-    credentials = base64.b64encode(b"admin:changeme").decode("utf-8")
-    return {"Authorization": f"Basic {credentials}"}
 
+@pytest.fixture(scope="session")
+def privacy_layer() -> PrivacyLayer:
+    """Create a privacy layer shared by the whole session."""
+    return PrivacyLayer()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_project() -> ProjectInput:
     """Create a sample project input for testing."""
     return ProjectInput(
@@ -3,58 +3,50 @@
 import pytest
 
 from wowasi_ya.core.agent_discovery import AgentDiscoveryService
+from wowasi_ya.models.agent import DomainMatch
 from wowasi_ya.models.project import ProjectInput
 
 
-class TestAgentDiscoveryService:
-    """Tests for AgentDiscoveryService."""
+@pytest.fixture(scope="module")
+def service() -> AgentDiscoveryService:
+    """Create one discovery service for the module."""
+    return AgentDiscoveryService()
 
-    def test_analyze_project_finds_healthcare_domain(
-        self, sample_project: ProjectInput
-    ) -> None:
-        """Test that healthcare keywords are detected."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
 
-        domain_names = [d.domain for d in domains]
-        assert "healthcare" in domain_names
+@pytest.fixture(scope="module")
+def domains(service: AgentDiscoveryService, sample_project: ProjectInput) -> list[DomainMatch]:
+    """Analyze the sample project once for every test that only reads the result."""
+    return service.analyze_project(sample_project)
 
-    def test_analyze_project_finds_tribal_domain(
-        self, sample_project: ProjectInput
-    ) -> None:
-        """Test that tribal governance keywords are detected."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
 
-        domain_names = [d.domain for d in domains]
-        assert "tribal_governance" in domain_names
+class TestAgentDiscoveryService:
+    """Tests for AgentDiscoveryService."""
 
-    def test_analyze_project_finds_rural_domain(
-        self, sample_project: ProjectInput
+    @pytest.mark.parametrize(
+        "expected", ["healthcare", "tribal_governance", "rural_community"]
+    )
+    def test_analyze_project_finds_expected_domain(
+        self, domains: list[DomainMatch], expected: str
     ) -> None:
-        """Test that rural community keywords are detected."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
-
-        domain_names = [d.domain for d in domains]
-        assert "rural_community" in domain_names
+        """Test that healthcare, tribal governance and rural keywords are detected."""
+        assert expected in {d.domain for d in domains}
 
     def test_analyze_project_no_domains_for_minimal(
-        self, sample_project_minimal: ProjectInput
+        self, service: AgentDiscoveryService, sample_project_minimal: ProjectInput
     ) -> None:
         """Test that minimal project has fewer domain matches."""
-        service = AgentDiscoveryService()
         domains = service.analyze_project(sample_project_minimal)
 
         # Simple task tracking app shouldn't match specific domains
         assert len(domains) <= 1
 
     def test_generate_agents_creates_agents(
-        self, sample_project: ProjectInput
+        self,
+        service: AgentDiscoveryService,
+        sample_project: ProjectInput,
+        domains: list[DomainMatch],
     ) -> None:
         """Test that agents are generated from domain matches."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
         agents = service.generate_agents(sample_project, domains)
 
         assert len(agents) > 0
@@ -64,10 +56,9 @@ class TestAgentDiscoveryService:
             assert len(agent.search_queries) > 0
 
     def test_discover_returns_both_domains_and_agents(
-        self, sample_project: ProjectInput
+        self, service: AgentDiscoveryService, sample_project: ProjectInput
     ) -> None:
         """Test the full discovery pipeline."""
-        service = AgentDiscoveryService()
         domains, agents = service.discover(sample_project)
 
         assert len(domains) > 0
@@ -76,22 +67,16 @@ class TestAgentDiscoveryService:
         assert len(agents) >= len(domains)
 
     def test_confidence_scores_are_valid(
-        self, sample_project: ProjectInput
+        self, domains: list[DomainMatch]
     ) -> None:
         """Test that confidence scores are in valid range."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
-
         for domain in domains:
             assert 0.0 <= domain.confidence <= 1.0
 
     def test_domains_sorted_by_confidence(
-        self, sample_project: ProjectInput
+        self, domains: list[DomainMatch]
     ) -> None:
         """Test that domains are sorted by confidence descending."""
-        service = AgentDiscoveryService()
-        domains = service.analyze_project(sample_project)
-
         if len(domains) > 1:
             for i in range(len(domains) - 1):
                 assert domains[i].confidence >= domains[i + 1].confidence
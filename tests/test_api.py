@@ -1,8 +1,27 @@
 """Tests for the FastAPI routes."""
 
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
+from wowasi_ya.main import create_app
+
+
+@pytest.fixture(scope="module")
+def created_project_id(client: TestClient, auth_headers: dict[str, str]) -> str:
+    """Create one project shared by the workflow tests."""
+    response = client.post(
+        "/api/v1/projects",
+        headers=auth_headers,
+        json={
+            "name": "Healthcare App",
+            "description": "A telehealth application for tribal communities with HIPAA compliance.",
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["project_id"]
+
 
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
@@ -50,6 +69,22 @@ class TestProjectEndpoints:
         assert "project_id" in data
         assert data["status"] == "agent_discovery"
 
+    def test_create_project_rejects_unknown_output_format(
+        self, client: TestClient, auth_headers: dict[str, str]
+    ) -> None:
+        """Test that output formats outside the supported set are rejected."""
+        response = client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "name": "Test Project",
+                "description": "A test project description that is long enough.",
+                "output_format": "pdf",
+            },
+        )
+
+        assert response.status_code == 422
+
     def test_list_projects_requires_auth(self, client: TestClient) -> None:
         """Test that listing projects requires authentication."""
         response = client.get("/api/v1/projects")
@@ -81,24 +116,11 @@ class TestProjectWorkflow:
     """Tests for the full project workflow."""
 
     def test_create_and_discover(
-        self, client: TestClient, auth_headers: dict[str, str]
+        self, client: TestClient, auth_headers: dict[str, str], created_project_id: str
     ) -> None:
         """Test creating a project and running discovery."""
-        # Create project
-        create_response = client.post(
-            "/api/v1/projects",
-            headers=auth_headers,
-            json={
-                "name": "Healthcare App",
-                "description": "A telehealth application for tribal communities with HIPAA compliance.",
-            },
-        )
-        assert create_response.status_code == 200
-        project_id = create_response.json()["project_id"]
-
-        # Get discovery results
         discovery_response = client.get(
-            f"/api/v1/projects/{project_id}/discovery",
+            f"/api/v1/projects/{created_project_id}/discovery",
             headers=auth_headers,
         )
         assert discovery_response.status_code == 200
@@ -111,28 +133,43 @@ class TestProjectWorkflow:
         assert len(data["agents"]) > 0
 
     def test_get_status_after_create(
-        self, client: TestClient, auth_headers: dict[str, str]
+        self, client: TestClient, auth_headers: dict[str, str], created_project_id: str
     ) -> None:
         """Test getting project status after creation."""
-        # Create project
-        create_response = client.post(
-            "/api/v1/projects",
-            headers=auth_headers,
-            json={
-                "name": "Status Test",
-                "description": "Testing the status endpoint with a simple project.",
-            },
-        )
-        project_id = create_response.json()["project_id"]
-
-        # Get status
         status_response = client.get(
-            f"/api/v1/projects/{project_id}/status",
+            f"/api/v1/projects/{created_project_id}/status",
             headers=auth_headers,
         )
         assert status_response.status_code == 200
 
         data = status_response.json()
-        assert data["project_id"] == project_id
+        assert data["project_id"] == created_project_id
         assert "status" in data
         assert "phase" in data
+
+
+class TestPortal:
+    """Tests for serving the built portal."""
+
+    def test_index_is_cached_with_etag(self, tmp_path: Path) -> None:
+        """Test that SPA routes serve index.html and honor If-None-Match."""
+        (tmp_path / "index.html").write_text("<html>portal</html>")
+        portal_client = TestClient(create_app(portal_dir=tmp_path))
+
+        response = portal_client.get("/projects/123")
+        assert response.status_code == 200
+        assert response.text == "<html>portal</html>"
+        etag = response.headers["etag"]
+
+        cached = portal_client.get("/projects/456", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+    def test_static_files_and_api_take_precedence(self, tmp_path: Path) -> None:
+        """Test that real files are served and API routes are not shadowed."""
+        (tmp_path / "index.html").write_text("<html>portal</html>")
+        (tmp_path / "vite.svg").write_text("<svg/>")
+        portal_client = TestClient(create_app(portal_dir=tmp_path))
+
+        assert portal_client.get("/").text == "<html>portal</html>"
+        assert portal_client.get("/vite.svg").text == "<svg/>"
+        assert portal_client.get("/api/v1/health").json()["status"] == "healthy"
@@ -0,0 +1,46 @@
+"""Tests for audit logging."""
+
+from datetime import datetime
+from pathlib import Path
+
+from wowasi_ya.db.audit import AuditAction, AuditLogger
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger."""
+
+    def test_log_writes_immediately(self, tmp_path: Path) -> None:
+        """Test that each entry is appended as soon as it is logged."""
+        logger = AuditLogger(tmp_path / "audit.jsonl")
+        logger.log(AuditAction.PROJECT_CREATED, project_id="p1")
+
+        assert len(logger.log_path.read_text().splitlines()) == 1
+
+    def test_project_logs_and_api_counts(self, tmp_path: Path) -> None:
+        """Test per-project lookups and API call counts."""
+        logger = AuditLogger(tmp_path / "audit.jsonl")
+        logger.log(AuditAction.API_CALL_RESEARCH, project_id="p1")
+        logger.log(AuditAction.API_CALL_GENERATE, project_id="p2")
+        first_count = logger.get_api_call_count()
+        cutoff = datetime.utcnow()
+        logger.log(AuditAction.API_CALL_RESEARCH, project_id="p1")
+        logger.log(AuditAction.API_CALL_RESEARCH, project_id="p1", success=False)
+
+        assert first_count["total_api_calls"] == 2
+        assert logger.get_api_call_count() == {
+            "research_calls": 2,
+            "generation_calls": 1,
+            "total_api_calls": 3,
+        }
+        assert logger.get_api_call_count(since=cutoff)["total_api_calls"] == 1
+        assert len(logger.get_logs(project_id="p1")) == 3
+        assert len(logger.get_logs(project_id="p1", limit=2)) == 2
+        assert logger.get_logs(project_id="missing") == []
+
+        reloaded = AuditLogger(logger.log_path)
+        assert reloaded.get_api_call_count()["research_calls"] == 2
+        assert [log.success for log in reloaded.get_logs(project_id="p1")] == [
+            True,
+            True,
+            False,
+        ]
@@ -0,0 +1,95 @@
+"""Tests for the next steps engine."""
+
+from pathlib import Path
+
+import pytest
+
+from wowasi_ya.core.next_steps import (
+    NextStepsEngine,
+    NextStepsStore,
+    OutlineMappingStore,
+    build_progress,
+)
+from wowasi_ya.models.document import DocumentType
+from wowasi_ya.models.next_steps import TEMPLATE_BY_ID, ProjectNextStep, StepStatus
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> NextStepsEngine:
+    """Create an engine backed by temporary stores."""
+    return NextStepsEngine(
+        steps_store=NextStepsStore(tmp_path / "next_steps.jsonl"),
+        mapping_store=OutlineMappingStore(tmp_path / "outline_mappings.jsonl"),
+    )
+
+
+class TestCreateSteps:
+    """Tests for creating steps from templates."""
+
+    def test_steps_match_validated_construction(self, engine: NextStepsEngine) -> None:
+        """Test that template-built steps equal validated ones and own their config."""
+        steps = engine.create_steps_for_project("p1", [DocumentType.PROJECT_BRIEF])
+
+        for step in steps:
+            assert ProjectNextStep.model_validate(step.model_dump()) == step
+            template = TEMPLATE_BY_ID[step.template_id]
+            assert step.action_config == template.action_config
+            assert step.action_config is not template.action_config
+
+
+class TestProgress:
+    """Tests for progress aggregation."""
+
+    def test_counts_statuses_by_document_type(self, engine: NextStepsEngine) -> None:
+        """Test that statuses are tallied overall and per document type."""
+        steps = engine.create_steps_for_project(
+            "p1", [DocumentType.PROJECT_BRIEF, DocumentType.STATUS_UPDATES]
+        )
+        steps[0].status = StepStatus.COMPLETED
+        steps[1].status = StepStatus.SKIPPED
+
+        progress = build_progress("p1", steps)
+
+        assert progress.total_steps == len(steps)
+        assert progress.completed_steps == 1
+        assert progress.skipped_steps == 1
+        assert progress.not_started_steps == len(steps) - 2
+        assert progress.completion_percentage == round(2 / len(steps) * 100, 1)
+        assert list(progress.by_document_type) == ["Project-Brief", "Status-Updates"]
+        assert sum(c["total"] for c in progress.by_document_type.values()) == len(steps)
+
+    def test_empty_project(self) -> None:
+        """Test that a project without steps reports zero progress."""
+        progress = build_progress("p1", [])
+
+        assert progress.total_steps == 0
+        assert progress.completion_percentage == 0.0
+        assert progress.by_document_type == {}
+
+    def test_engine_reads_steps_from_store(self, engine: NextStepsEngine) -> None:
+        """Test that the engine aggregates the stored steps for a project."""
+        step = engine.create_steps_for_project("p1", [DocumentType.README])[0]
+        engine.complete_step(step.id)
+        engine.create_steps_for_project("p2", [DocumentType.README])
+
+        progress = engine.get_progress("p1")
+
+        assert progress.completed_steps == 1
+        assert progress.total_steps == len(engine.get_steps("p1"))
+
+
+class TestOutlineMappingStore:
+    """Tests for outline mapping persistence."""
+
+    def test_mapping_round_trips_through_disk(self, tmp_path: Path) -> None:
+        """Test that saved mappings load back unchanged."""
+        path = tmp_path / "outline_mappings.jsonl"
+        engine = NextStepsEngine(
+            steps_store=NextStepsStore(tmp_path / "next_steps.jsonl"),
+            mapping_store=OutlineMappingStore(path),
+        )
+        mapping = engine.save_outline_mapping(
+            "p1", "col-1", "https://outline.example/col-1", {"readme": "doc-1"}
+        )
+
+        assert OutlineMappingStore(path).get_by_project("p1") == mapping
@@ -0,0 +1,113 @@
+"""Tests for the output writers."""
+
+import io
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from wowasi_ya.core.output import FilesystemWriter, GoogleDriveWriter, ObsidianWriter
+from wowasi_ya.models.document import Document, DocumentType, GeneratedProject
+
+
+def _make_project() -> GeneratedProject:
+    """Create a small generated project for writer tests."""
+    return GeneratedProject(
+        project_name="Test Project",
+        documents=[
+            Document(
+                type=DocumentType.README,
+                title="README",
+                content="# README\n\nSee [Brief](Project-Brief.md) – details.",
+                folder="00-Overview",
+                filename="README.md",
+            ),
+            Document(
+                type=DocumentType.PROJECT_BRIEF,
+                title="Project Brief",
+                content="# Project Brief\n\nNo links here.",
+                folder="00-Overview",
+                filename="Project-Brief.md",
+            ),
+        ],
+    )
+
+
+class TestFilesystemWriter:
+    """Tests for FilesystemWriter."""
+
+    async def test_writes_documents_in_folders(self, tmp_path: Path) -> None:
+        """Test that each document is written under its folder."""
+        project = _make_project()
+
+        paths = await FilesystemWriter().write(project, tmp_path)
+
+        assert len(paths) == 2
+        readme = tmp_path / "Test Project" / "00-Overview" / "README.md"
+        assert readme.read_text(encoding="utf-8") == project.documents[0].content
+
+    async def test_uses_pre_encoded_content(self, tmp_path: Path) -> None:
+        """Test that shared pre-encoded bytes are written as-is."""
+        project = _make_project()
+        encoded = {"README.md": b"cached"}
+
+        await FilesystemWriter(encoded).write(project, tmp_path)
+
+        readme = tmp_path / "Test Project" / "00-Overview" / "README.md"
+        assert readme.read_bytes() == b"cached"
+
+
+class TestObsidianWriter:
+    """Tests for ObsidianWriter."""
+
+    def test_converts_markdown_links(self, tmp_path: Path) -> None:
+        """Test that document links become wiki links."""
+        writer = ObsidianWriter(tmp_path)
+        project = _make_project()
+
+        content = writer._convert_links(project.documents[0].content, project)
+
+        assert "[[Project-Brief|Brief]]" in content
+
+    def test_leaves_content_without_links_untouched(self, tmp_path: Path) -> None:
+        """Test that content without links is returned unchanged."""
+        writer = ObsidianWriter(tmp_path)
+        project = _make_project()
+
+        content = project.documents[1].content
+        assert writer._convert_links(content, project) is content
+
+
+class TestGoogleDriveWriter:
+    """Tests for GoogleDriveWriter."""
+
+    async def test_streams_archive_above_threshold(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that large projects are streamed to rclone as a single archive."""
+        uploads: list[tuple[list[str], io.BytesIO]] = []
+
+        class FakeProcess:
+            def __init__(self, args: list[str], **_kwargs: object) -> None:
+                self.args = args
+                self.stdin = io.BytesIO()
+                self.returncode = 0
+                uploads.append((args, self.stdin))
+
+            def communicate(self) -> tuple[bytes, bytes]:
+                return b"", b""
+
+        monkeypatch.setattr("wowasi_ya.core.output.subprocess.Popen", FakeProcess)
+        writer = GoogleDriveWriter(
+            remote_path="gdrive:Test",
+            local_cache=tmp_path,
+            archive_threshold=1,
+        )
+
+        await writer.write(_make_project(), tmp_path)
+
+        assert len(uploads) == 1
+        args, stdin = uploads[0]
+        assert args[:3] == ["rclone", "rcat", "gdrive:Test/04_Iyeska/Test Project.tar.gz"]
+        with tarfile.open(fileobj=io.BytesIO(stdin.getvalue()), mode="r:gz") as archive:
+            assert "Test Project/00-Overview/README.md" in archive.getnames()
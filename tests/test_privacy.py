@@ -1,17 +1,42 @@
 """Tests for the privacy layer."""
 
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
 
-from wowasi_ya.core.privacy import PrivacyLayer, SensitiveDataType
+from wowasi_ya.core.privacy import (
+    _FALLBACK_KINDS,
+    _FALLBACK_PATTERN,
+    PrivacyConfig,
+    PrivacyFlag,
+    PrivacyLayer,
+    SensitiveDataType,
+    _split_paragraph_chunks,
+)
+
+
+class _PatternAnalyzer:
+    """Stand-in for Presidio's analyzer built on the fallback patterns."""
+
+    def analyze(self, text: str, **_: Any) -> list[SimpleNamespace]:
+        results = []
+        for match in _FALLBACK_PATTERN.finditer(text):
+            data_type, score = _FALLBACK_KINDS[match.lastgroup or ""]
+            results.append(
+                SimpleNamespace(
+                    entity_type=data_type.value, start=match.start(), end=match.end(), score=score
+                )
+            )
+        return results
 
 
 class TestPrivacyLayer:
     """Tests for PrivacyLayer."""
 
-    def test_detects_email_address(self) -> None:
+    def test_detects_email_address(self, privacy_layer: PrivacyLayer) -> None:
         """Test that email addresses are detected."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("Contact us at john.doe@example.com for more info.")
+        result = privacy_layer.scan("Contact us at john.doe@example.com for more info.")
 
         assert result.requires_approval
         assert len(result.flags) >= 1
@@ -20,87 +45,147 @@ class TestPrivacyLayer:
         assert len(email_flags) >= 1
         assert "john.doe@example.com" in email_flags[0].text
 
-    def test_detects_phone_number(self) -> None:
+    def test_detects_phone_number(self, privacy_layer: PrivacyLayer) -> None:
         """Test that phone numbers are detected."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("Call us at (555) 123-4567 today!")
+        result = privacy_layer.scan("Call us at (555) 123-4567 today!")
 
         assert result.requires_approval
         phone_flags = [f for f in result.flags if f.data_type == SensitiveDataType.PHONE]
         assert len(phone_flags) >= 1
 
-    def test_detects_ssn(self) -> None:
+    def test_detects_ssn(self, privacy_layer: PrivacyLayer) -> None:
         """Test that SSN patterns are detected."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("SSN: 123-45-6789")
+        result = privacy_layer.scan("SSN: 123-45-6789")
 
         assert result.requires_approval
         ssn_flags = [f for f in result.flags if f.data_type == SensitiveDataType.SSN]
         assert len(ssn_flags) >= 1
 
-    def test_no_flags_for_clean_text(self) -> None:
+    def test_no_flags_for_clean_text(self, privacy_layer: PrivacyLayer) -> None:
         """Test that clean text has no privacy flags."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("This is a completely clean description of a project.")
+        result = privacy_layer.scan("This is a completely clean description of a project.")
 
         assert not result.requires_approval
         assert len(result.flags) == 0
 
-    def test_sanitizes_sensitive_data(self) -> None:
+    def test_sanitizes_sensitive_data(self, privacy_layer: PrivacyLayer) -> None:
         """Test that sensitive data is sanitized in output."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("Contact john.doe@example.com or call 555-123-4567")
+        result = privacy_layer.scan("Contact john.doe@example.com or call 555-123-4567")
 
         assert "[EMAIL_ADDRESS]" in result.sanitized_text or "[PHONE_NUMBER]" in result.sanitized_text
         assert "john.doe@example.com" not in result.sanitized_text
 
-    def test_counts_risk_levels(self) -> None:
+    def test_counts_risk_levels(self, privacy_layer: PrivacyLayer) -> None:
         """Test that risk levels are properly counted."""
-        privacy = PrivacyLayer()
         # SSN is high risk, email is medium risk
-        result = privacy.scan("SSN: 123-45-6789, email: test@test.com")
+        result = privacy_layer.scan("SSN: 123-45-6789, email: test@test.com")
 
         assert result.high_risk_count >= 1 or result.medium_risk_count >= 1
 
-    def test_provides_context_for_review(self) -> None:
+    def test_provides_context_for_review(self, privacy_layer: PrivacyLayer) -> None:
         """Test that context is provided for each flag."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("Please contact john.doe@example.com for details.")
+        result = privacy_layer.scan("Please contact john.doe@example.com for details.")
 
         for flag in result.flags:
             assert len(flag.context) > 0
             # Context should include surrounding text
             assert "..." in flag.context or flag.text in flag.context
 
-    def test_approve_clears_approval_requirement(self) -> None:
+    def test_approve_clears_approval_requirement(self, privacy_layer: PrivacyLayer) -> None:
         """Test that approving a scan result clears the flag."""
-        privacy = PrivacyLayer()
-        result = privacy.scan("Contact: john.doe@example.com")
+        result = privacy_layer.scan("Contact: john.doe@example.com")
 
         assert result.requires_approval
-        approved = privacy.approve(result)
+        approved = privacy_layer.approve(result)
         assert not approved.requires_approval
 
 
 class TestPrivacyLayerMultipleItems:
     """Tests for detecting multiple sensitive items."""
 
-    def test_detects_multiple_emails(self) -> None:
+    def test_detects_multiple_emails(self, privacy_layer: PrivacyLayer) -> None:
         """Test detection of multiple email addresses."""
-        privacy = PrivacyLayer()
-        result = privacy.scan(
+        result = privacy_layer.scan(
             "Contact alice@example.com or bob@example.org for assistance."
         )
 
         email_flags = [f for f in result.flags if f.data_type == SensitiveDataType.EMAIL]
         assert len(email_flags) >= 2
 
-    def test_detects_mixed_sensitive_data(self) -> None:
+    def test_detects_mixed_sensitive_data(self, privacy_layer: PrivacyLayer) -> None:
         """Test detection of multiple types of sensitive data."""
-        privacy = PrivacyLayer()
-        result = privacy.scan(
+        result = privacy_layer.scan(
             "Name: John Doe, Email: john@test.com, Phone: 555-123-4567"
         )
 
         types_found = {f.data_type for f in result.flags}
         assert len(types_found) >= 2
+
+    def test_sanitizes_multiple_items_in_place(self, privacy_layer: PrivacyLayer) -> None:
+        """Test that every flagged span is replaced and surrounding text is kept."""
+        text = "Email alice@example.com, SSN 123-45-6789, done."
+        flags = [
+            PrivacyFlag(data_type=SensitiveDataType.SSN, text="123-45-6789", start=29, end=40, confidence=0.9),
+            PrivacyFlag(data_type=SensitiveDataType.EMAIL, text="alice@example.com", start=6, end=23, confidence=0.9),
+        ]
+
+        sanitized = privacy_layer._sanitize(text, flags)
+
+        assert sanitized == "Email [EMAIL_ADDRESS], SSN [US_SSN], done."
+
+
+class TestParagraphChunking:
+    """Tests for splitting long text before analysis."""
+
+    def test_chunks_cover_text_with_correct_offsets(self) -> None:
+        """Test that chunks reassemble to the original text at their offsets."""
+        text = "a" * 10 + "\n\n" + "b" * 10 + "\n\n" + "c" * 30
+        chunks = _split_paragraph_chunks(text, 16)
+
+        assert "".join(chunk for _, chunk in chunks) == text
+        for offset, chunk in chunks:
+            assert text[offset : offset + len(chunk)] == chunk
+
+    def test_chunks_break_on_paragraphs(self) -> None:
+        """Test that chunk boundaries prefer blank lines."""
+        text = "first paragraph\n\nsecond paragraph"
+        chunks = _split_paragraph_chunks(text, 20)
+
+        assert chunks[0] == (0, "first paragraph\n\n")
+
+    def test_single_paragraph_breaks_at_whitespace(self) -> None:
+        """Test that text without blank lines is not cut inside a word."""
+        text = "Applicant record SSN 123-45-6789 is on file for review today"
+        # A plain cut at 24 characters would land inside the SSN
+        chunks = _split_paragraph_chunks(text, 24)
+
+        assert any("123-45-6789" in chunk for _, chunk in chunks)
+        for offset, chunk in chunks:
+            assert text[offset : offset + len(chunk)] == chunk
+        assert chunks[-1][0] + len(chunks[-1][1]) == len(text)
+
+    def test_overlapping_chunks_cover_text(self) -> None:
+        """Test that overlapping chunks still start at their offsets and cover the text."""
+        text = " ".join(f"word{i}" for i in range(40))
+        chunks = _split_paragraph_chunks(text, 30, overlap=12)
+
+        covered = 0
+        for offset, chunk in chunks:
+            assert text[offset : offset + len(chunk)] == chunk
+            assert offset <= covered
+            covered = offset + len(chunk)
+        assert covered == len(text)
+
+    def test_scan_catches_pii_straddling_chunk_boundary(self) -> None:
+        """Test that chunked analysis finds PII across a boundary exactly once."""
+        privacy = PrivacyLayer(PrivacyConfig(chunk_size=40, chunk_overlap=24))
+        privacy._analyzer = _PatternAnalyzer()
+        text = "The applicant can be reached by phone at (555) 123-4567 and SSN 123-45-6789 ok"
+
+        result = privacy.scan(text)
+
+        assert "123-45-6789" not in result.sanitized_text
+        assert "123-4567" not in result.sanitized_text
+        spans = [(f.data_type, f.start, f.end) for f in result.flags]
+        assert len(spans) == len(set(spans))
+        assert {f.data_type for f in result.flags} == {SensitiveDataType.PHONE, SensitiveDataType.SSN}
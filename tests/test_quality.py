@@ -0,0 +1,148 @@
+"""Tests for the quality checker."""
+
+import pytest
+
+from wowasi_ya.core.quality import IssueSeverity, QualityChecker, QualityIssue
+from wowasi_ya.models.document import Document, DocumentType, GeneratedProject
+
+
+def _make_document(content: str, filename: str = "README.md") -> Document:
+    """Create a document with the given content."""
+    return Document(
+        type=DocumentType.README,
+        title="README",
+        content=content,
+        folder="00-Overview",
+        filename=filename,
+    )
+
+
+class TestDocumentWordCount:
+    """Tests for the word count the checks rely on."""
+
+    def test_word_count_follows_reassigned_content(self) -> None:
+        """Test that replacing the content recounts its words."""
+        document = _make_document("one two three")
+        assert document.word_count == 3
+
+        document.content = "# Placeholder"
+
+        assert document.word_count == 2
+
+    def test_explicit_word_count_is_kept(self) -> None:
+        """Test that error documents can report zero words and dumps round-trip."""
+        document = Document(
+            type=DocumentType.README,
+            title="README",
+            content="# README\n\n*Error generating document*",
+            folder="00-Overview",
+            filename="README.md",
+            word_count=0,
+        )
+
+        assert document.word_count == 0
+        assert Document.model_validate(document.model_dump()).word_count == 0
+
+
+class TestDocumentChecks:
+    """Tests for single-document checks."""
+
+    def test_detects_placeholders_case_insensitively(self) -> None:
+        """Test that each placeholder on a line is reported once."""
+        checker = QualityChecker()
+        doc = _make_document("# Title\n\nIntro text\nSee [todo] and fixme, fixme\n")
+
+        issues = list(checker._check_placeholders(doc))
+
+        assert [(i.message, i.line) for i in issues] == [
+            ("Placeholder text found: [TODO]", 4),
+            ("Placeholder text found: FIXME", 4),
+        ]
+
+    def test_no_placeholders_in_clean_text(self) -> None:
+        """Test that clean content has no placeholder issues."""
+        checker = QualityChecker()
+        doc = _make_document("# Title\n\nEverything here is finished.\n")
+
+        assert list(checker._check_placeholders(doc)) == []
+
+    def test_detects_empty_sections(self) -> None:
+        """Test that a heading with no content is flagged."""
+        checker = QualityChecker()
+        doc = _make_document("# Title\n\nIntro.\n\n## Empty\n\n## Filled\n\nSome content.\n")
+
+        issues = list(checker._check_empty_sections(doc))
+
+        assert [i.message for i in issues] == ["Empty section: ## Empty"]
+
+    def test_missing_title_is_an_error(self) -> None:
+        """Test that documents must start with a heading."""
+        checker = QualityChecker()
+        doc = _make_document("No heading here.")
+
+        issues = checker.check_document(doc)
+
+        assert any(
+            i.severity == IssueSeverity.ERROR and "title heading" in i.message for i in issues
+        )
+
+
+class TestQualityScore:
+    """Tests for quality scoring."""
+
+    def test_perfect_score_without_issues(self) -> None:
+        """Test that no issues gives a perfect score."""
+        assert QualityChecker().get_quality_score([]) == 1.0
+
+    def test_weights_by_severity(self) -> None:
+        """Test that deductions are weighted by severity."""
+        issues = [
+            QualityIssue(document="a.md", severity=IssueSeverity.ERROR, message="e"),
+            QualityIssue(document="a.md", severity=IssueSeverity.WARNING, message="w"),
+            QualityIssue(document="a.md", severity=IssueSeverity.INFO, message="i"),
+        ]
+
+        assert QualityChecker().get_quality_score(issues) == pytest.approx(0.74)
+
+
+class TestCrossReferences:
+    """Tests for cross-document checks."""
+
+    def test_extracts_bold_and_heading_glossary_terms(self) -> None:
+        """Test that both glossary term forms are collected."""
+        glossary = _make_document(
+            "# Glossary\n\n**HIPAA** - health privacy law\n\n## IHS\n\n## **EHR** records\n",
+            filename="Glossary.md",
+        )
+
+        terms = QualityChecker()._extract_glossary_terms(glossary)
+
+        assert terms == {"hipaa", "ihs", "**ehr** records", "ehr"}
+
+
+class TestCheckProject:
+    """Tests for whole-project checks."""
+
+    def test_report_groups_issues_by_severity(self) -> None:
+        """Test that the report lists each severity group with its count."""
+        project = GeneratedProject(
+            project_name="Test",
+            documents=[_make_document("No heading, just [TODO] text.")],
+        )
+
+        report = QualityChecker().generate_quality_report(project)
+
+        assert "Quality Score:" in report
+        assert "[red]Errors (3):[/red]" in report
+        assert "[yellow]Warnings (2):[/yellow]" in report
+
+    def test_reuses_results_for_unchanged_documents(self) -> None:
+        """Test that unchanged documents are not re-checked."""
+        checker = QualityChecker()
+        doc = _make_document("# Title\n\nSome [TODO] text.\n")
+
+        first = checker.check_document(doc)
+        checker._run_document_checks = None  # type: ignore[assignment]
+        second = checker.check_document(doc)
+
+        assert second == first
@@ -0,0 +1,333 @@
+"""Tests for the research engine."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from wowasi_ya.config import Settings
+from wowasi_ya.core import research
+from wowasi_ya.core.llm_client import ClaudeClient
+from wowasi_ya.core.research import ResearchConfig, ResearchEngine
+from wowasi_ya.models.agent import AgentDefinition, AgentResult
+
+
+def _agent(agent_id: str = "agent_test") -> AgentDefinition:
+    """Build a minimal agent definition."""
+    return AgentDefinition(
+        id=agent_id,
+        name="Test Agent",
+        role="Test Researcher",
+        domains=["testing"],
+        research_questions=["What is tested?"],
+        search_queries=["testing best practices"],
+    )
+
+
+@pytest.fixture
+def research_settings(test_settings: Settings, tmp_path: Path) -> Settings:
+    """Test settings with the research cache under a temporary directory."""
+    return test_settings.model_copy(update={"output_dir": tmp_path})
+
+
+class FakeStream:
+    """Stand-in for the Anthropic message stream context manager."""
+
+    def __init__(self, deltas: list[str], delay: float = 0.0) -> None:
+        self.deltas = deltas
+        self.delay = delay
+
+    async def __aenter__(self) -> "FakeStream":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    @property
+    async def text_stream(self) -> Any:
+        for delta in self.deltas:
+            await asyncio.sleep(self.delay)
+            yield delta
+
+    async def get_final_message(self) -> Any:
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=10, output_tokens=20))
+
+
+class TestResearchEngine:
+    """Tests for ResearchEngine."""
+
+    async def test_engines_share_client(self, research_settings: Settings) -> None:
+        """Test that engines reuse one Anthropic client and connection pool."""
+        first = ResearchEngine(research_settings)
+        second = ResearchEngine(research_settings)
+        try:
+            assert first._ensure_client() is second._ensure_client()
+            assert first._ensure_client().max_retries == research._MAX_RETRIES
+            generation = ClaudeClient(research_settings)._ensure_client()
+            assert generation._client is first._ensure_client()._client
+        finally:
+            await ResearchEngine.close_shared_client()
+        assert ResearchEngine._shared_clients == {}
+
+    async def test_engines_with_other_keys_get_own_client(
+        self, research_settings: Settings
+    ) -> None:
+        """Test that an engine never reuses a client built for another API key."""
+        other_settings = research_settings.model_copy(
+            update={"anthropic_api_key": SecretStr("other-key")}
+        )
+        first = ResearchEngine(research_settings)
+        other = ResearchEngine(other_settings)
+        try:
+            assert first._ensure_client() is not other._ensure_client()
+            assert other._ensure_client().api_key == "other-key"
+        finally:
+            await ResearchEngine.close_shared_client()
+
+    async def test_execute_agent_times_out(
+        self, research_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a hung API call becomes an error result."""
+        engine = ResearchEngine(research_settings, ResearchConfig(timeout_seconds=30))
+        engine.config.timeout_seconds = 0.01  # type: ignore[assignment]
+
+        client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **_kwargs: FakeStream(["x"], delay=10))
+        )
+        monkeypatch.setattr(engine, "_ensure_client", lambda: client)
+
+        result = await engine.execute_agent(_agent(), "context")
+
+        assert result.agent_id == "agent_test"
+        assert "timed out" in result.findings[0]
+
+    def test_timeout_comes_from_settings(self, research_settings: Settings) -> None:
+        """Test that the per-agent timeout is configurable through settings."""
+        settings = research_settings.model_copy(update={"research_timeout": 900})
+
+        assert ResearchEngine(settings).config.timeout_seconds == 900
+
+    async def test_execute_agent_parses_streamed_text(
+        self, research_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that streamed deltas split mid-line are parsed into sections."""
+        engine = ResearchEngine(research_settings)
+        deltas = ["KEY FIND", "INGS\n- First", " finding\nSOURCES:\n- https://", "example.com"]
+        calls: list[dict[str, Any]] = []
+
+        def stream(**kwargs: Any) -> FakeStream:
+            calls.append(kwargs)
+            return FakeStream(deltas)
+
+        client = SimpleNamespace(messages=SimpleNamespace(stream=stream))
+        monkeypatch.setattr(engine, "_ensure_client", lambda: client)
+
+        result = await engine.execute_agent(_agent(), "context")
+
+        assert result.findings == ("First finding",)
+        assert result.sources == ("https://example.com",)
+        assert result.raw_response == "".join(deltas)
+        assert (result.input_tokens, result.output_tokens) == (10, 20)
+        assert calls[0]["model"] == research_settings.claude_model
+        assert calls[0]["tools"] == [{"type": "web_search_20250305"}]
+
+    async def test_execute_agent_reuses_cached_result(
+        self, research_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an identical request is answered from the result cache."""
+        calls = 0
+
+        def stream(**_kwargs: Any) -> FakeStream:
+            nonlocal calls
+            calls += 1
+            return FakeStream(["KEY FINDINGS\n- Cached finding"])
+
+        client = SimpleNamespace(messages=SimpleNamespace(stream=stream))
+        cached_settings = research_settings.model_copy(update={"research_cache_ttl": 3600})
+        fewer_tokens = cached_settings.model_copy(update={"max_generation_tokens": 1000})
+
+        tokens: list[tuple[int, int]] = []
+        for settings, context in (
+            (cached_settings, "context"),
+            (cached_settings, "context"),
+            (cached_settings, "other context"),
+            (fewer_tokens, "context"),
+        ):
+            engine = ResearchEngine(settings)
+            monkeypatch.setattr(engine, "_ensure_client", lambda: client)
+            result = await engine.execute_agent(_agent(), context)
+            assert result.findings == ("Cached finding",)
+            tokens.append((result.input_tokens, result.output_tokens))
+
+        assert calls == 3
+        # Cache hits report no usage, so analytics does not bill them again
+        assert tokens == [(10, 20), (0, 0), (10, 20), (10, 20)]
+        cache_files = list((research_settings.output_dir / ".research_cache").iterdir())
+        assert len(cache_files) == 3
+        assert all(b"raw_response" not in path.read_bytes() for path in cache_files)
+
+    async def test_result_cache_is_off_by_default(
+        self, research_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that research results are neither cached nor keyed unless a TTL is set."""
+        engine = ResearchEngine(research_settings)
+        client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **_kwargs: FakeStream(["KEY FINDINGS\n- x"]))
+        )
+        monkeypatch.setattr(engine, "_ensure_client", lambda: client)
+        monkeypatch.setattr(engine, "_cache_key", pytest.fail)
+
+        result = await engine.execute_agent(_agent(), "context")
+
+        assert engine._cache is None
+        assert result.findings == ("x",)
+
+    async def test_execute_all_bounds_concurrency(
+        self, research_settings: Settings, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that at most max_concurrent_agents run and failures become results."""
+        engine = ResearchEngine(research_settings, ResearchConfig(max_concurrent_agents=2))
+        running = 0
+        peak = 0
+
+        async def fake_execute(agent: AgentDefinition, _context: str) -> AgentResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if agent.id == "agent_3":
+                raise RuntimeError("boom")
+            return AgentResult(agent_id=agent.id, findings=["ok"])
+
+        monkeypatch.setattr(engine, "execute_agent", fake_execute)
+
+        results = await engine.execute_all([_agent(f"agent_{i}") for i in range(6)], "ctx")
+
+        assert peak == 2
+        assert [r.agent_id for r in results] == [f"agent_{i}" for i in range(6)]
+        assert "boom" in results[3].findings[0]
+
+
+class TestRateLimiter:
+    """Tests for the research rate limiter."""
+
+    async def test_allows_burst_then_spaces_calls(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that calls beyond the per-period budget are delayed."""
+        now = 100.0
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(research.time, "monotonic", lambda: now)
+        monkeypatch.setattr(research.asyncio, "sleep", fake_sleep)
+
+        limiter = research._RateLimiter(3, time_period=60.0)
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert delays == [pytest.approx(20.0), pytest.approx(40.0)]
+
+    def test_engines_share_limiter(self, research_settings: Settings) -> None:
+        """Test that engines with the same budget share one bucket."""
+        assert ResearchEngine(research_settings)._limiter is ResearchEngine(research_settings)._limiter
+
+
+class TestPromptBuilding:
+    """Tests for research prompt rendering."""
+
+    def test_prompt_is_cached(self, research_settings: Settings) -> None:
+        """Test that identical agents and context reuse the rendered prompt."""
+        engine = ResearchEngine(research_settings)
+        first = engine._build_research_prompt(_agent(), "Project context")
+        second = engine._build_research_prompt(_agent(), "Project context")
+
+        assert first is second
+        assert "Project context" in first
+        assert "- What is tested?" in first
+
+    def test_frameworks_prompt_marks_static_block_cacheable(
+        self, research_settings: Settings
+    ) -> None:
+        """Test that the frameworks agent sends a cacheable static prefix."""
+        engine = ResearchEngine(research_settings)
+        agent = _agent("agent_000_frameworks")
+
+        content = engine._build_message_content(agent, "Project context")
+
+        assert isinstance(content, list)
+        static, dynamic = content
+        assert static["cache_control"] == {"type": "ephemeral"}
+        assert "Project context" not in static["text"]
+        assert "Project context" in dynamic["text"]
+        assert engine._build_research_prompt(agent, "Project context") == (
+            f"{static['text']}\n{dynamic['text']}"
+        )
+
+    def test_domain_prompt_is_plain_text(self, research_settings: Settings) -> None:
+        """Test that domain agents send a single text prompt."""
+        engine = ResearchEngine(research_settings)
+
+        assert isinstance(engine._build_message_content(_agent(), "ctx"), str)
+
+
+class TestResponseParsing:
+    """Tests for parsing research responses."""
+
+    def test_parse_sections(self, research_settings: Settings) -> None:
+        """Test that bullets are assigned to the section heading above them."""
+        text = (
+            "Intro line\n"
+            "- ignored before any section\n"
+            "### Key Findings\n"
+            "- First finding\n"
+            "* Second finding\n"
+            "Sources:\n"
+            "• https://example.com\n"
+            "Recommendations:\n"
+            "-  Do the thing\n"
+        )
+        response = SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+        result = ResearchEngine(research_settings)._parse_response(_agent(), response)
+
+        assert result.findings == ("First finding", "Second finding")
+        assert result.sources == ("https://example.com",)
+        assert result.recommendations == ("Do the thing",)
+        assert result.raw_response == text
+
+    def test_heading_naming_several_sections_opens_first(self, research_settings: Settings) -> None:
+        """Test that findings wins over sources, and sources over recommendations."""
+        text = (
+            "Sources: see the key findings\n"
+            "- Finding\n"
+            "Recommendations: cite the references: below\n"
+            "- Source\n"
+        )
+        response = SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+        result = ResearchEngine(research_settings)._parse_response(_agent(), response)
+
+        assert result.findings == ("Finding",)
+        assert result.sources == ("Source",)
+        assert result.recommendations == ()
+
+    def test_trusted_result_matches_validated(self) -> None:
+        """Test that the unvalidated factory builds the same result as the constructor."""
+        kwargs: dict[str, Any] = {
+            "agent_id": "agent_test",
+            "findings": ("A finding",),
+            "sources": (),
+            "recommendations": ("Do it",),
+            "raw_response": "raw",
+            "input_tokens": 3,
+            "output_tokens": 5,
+        }
+
+        assert AgentResult.from_trusted(**kwargs) == AgentResult(**kwargs)
@@ -0,0 +1,149 @@
+"""Tests for persistent project state storage."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from wowasi_ya.db import state as state_module
+from wowasi_ya.db.state import ProjectStateStore
+from wowasi_ya.models.project import ProjectInput, ProjectState
+
+
+def _state(project_id: str, sample_project: ProjectInput) -> ProjectState:
+    """Build a project state for the sample input."""
+    return ProjectState(id=project_id, input=sample_project)
+
+
+class TestProjectStateStore:
+    """Tests for ProjectStateStore."""
+
+    def test_updates_append_and_replay_latest(
+        self, tmp_path: Path, sample_project: ProjectInput
+    ) -> None:
+        """Test that updates append records and reload keeps the latest one."""
+        path = tmp_path / "states.jsonl"
+        store = ProjectStateStore(path)
+        state = _state("p1", sample_project)
+        store.set(state)
+        state.current_phase = 2
+        store.set(state)
+        store.set(_state("p2", sample_project))
+
+        assert len(path.read_text().splitlines()) == 3
+
+        reloaded = ProjectStateStore(path)
+        assert len(reloaded) == 2
+        assert reloaded.get("p1").current_phase == 2
+
+    def test_loads_legacy_free_form_input(
+        self, tmp_path: Path, sample_project: ProjectInput
+    ) -> None:
+        """Test that records stored before area/output_format were constrained still load."""
+        path = tmp_path / "states.jsonl"
+        ProjectStateStore(path).set(_state("p1", sample_project))
+        record = json.loads(path.read_text())
+        record["input"].update(area="06_Archive", output_format="docx")
+        path.write_text(json.dumps(record) + "\n")
+
+        loaded = ProjectStateStore(path).get("p1")
+
+        assert loaded is not None
+        assert loaded.input.area == "04_Iyeska"
+        assert loaded.input.output_format == "filesystem"
+        assert loaded.input.name == sample_project.name
+
+    def test_delete_survives_reload(
+        self, tmp_path: Path, sample_project: ProjectInput
+    ) -> None:
+        """Test that deletions are persisted as tombstones."""
+        path = tmp_path / "states.jsonl"
+        store = ProjectStateStore(path)
+        store.set(_state("p1", sample_project))
+        store.set(_state("p2", sample_project))
+
+        assert store.delete("p1") is True
+        assert store.delete("p1") is False
+
+        reloaded = ProjectStateStore(path)
+        assert reloaded.get("p1") is None
+        assert reloaded.get("p2") is not None
+
+    def test_compacts_stale_records(
+        self, tmp_path: Path, sample_project: ProjectInput, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the log is rewritten once stale records pile up."""
+        monkeypatch.setattr(state_module, "_MIN_COMPACTION_RECORDS", 4)
+        path = tmp_path / "states.jsonl"
+        store = ProjectStateStore(path)
+        state = _state("p1", sample_project)
+        for _ in range(4):
+            store.set(state)
+
+        assert len(path.read_text().splitlines()) == 1
+        assert not path.with_suffix(".tmp").exists()
+        assert ProjectStateStore(path).get("p1") is not None
+
+    def test_reload_validates_only_latest_records(
+        self,
+        tmp_path: Path,
+        sample_project: ProjectInput,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that superseded records are skipped without validation."""
+        path = tmp_path / "states.jsonl"
+        store = ProjectStateStore(path)
+        state = _state("p1", sample_project)
+        for phase in range(3):
+            state.current_phase = phase
+            store.set(state)
+        store.set(_state("p2", sample_project))
+        store.delete("p2")
+
+        validated: list[str | bytes] = []
+        original = ProjectState.model_validate_json
+
+        def counting_validate(data: str | bytes, **_kwargs: object) -> ProjectState:
+            validated.append(data)
+            return original(data)
+
+        monkeypatch.setattr(ProjectState, "model_validate_json", counting_validate)
+        reloaded = ProjectStateStore(path)
+
+        assert len(validated) == 1
+        assert reloaded.get("p1").current_phase == 2
+        assert reloaded.get("p2") is None
+
+    def test_torn_latest_record_falls_back_to_previous(
+        self, tmp_path: Path, sample_project: ProjectInput
+    ) -> None:
+        """Test that a record torn by a crash does not hide older valid ones."""
+        path = tmp_path / "states.jsonl"
+        store = ProjectStateStore(path)
+        state = _state("p1", sample_project)
+        store.set(state)
+        state.current_phase = 1
+        store.set(state)
+        with path.open("ab") as f:
+            f.write(b'{"id":"p1","input":{"na')
+
+        reloaded = ProjectStateStore(path)
+
+        assert reloaded.get("p1") is not None
+        assert reloaded.get("p1").current_phase == 1
+
+    def test_append_after_torn_tail_survives_reload(
+        self, tmp_path: Path, sample_project: ProjectInput
+    ) -> None:
+        """Test that a new record is not glued onto a torn last line."""
+        path = tmp_path / "states.jsonl"
+        ProjectStateStore(path).set(_state("p1", sample_project))
+        with path.open("ab") as f:
+            f.write(b'{"id":"p1","input":{"na')
+
+        store = ProjectStateStore(path)
+        store.set(_state("p2", sample_project))
+
+        reloaded = ProjectStateStore(path)
+        assert reloaded.get("p1") is not None
+        assert reloaded.get("p2") is not None